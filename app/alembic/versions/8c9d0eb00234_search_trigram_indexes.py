@@ -0,0 +1,62 @@
+"""
+app/alembic/versions/8c9d0eb00234_search_trigram_indexes.py
+
+検索用トライグラムインデックスのマイグレーション
+拠点・ユーザー一覧の部分一致検索（ILIKE '%term%'）をGINインデックスで高速化
+"""
+
+"""Search Trigram Indexes
+Revision ID: search_trigram_indexes
+Revises: location_management_system
+Create Date: 2025-03-22
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "search_trigram_indexes"
+down_revision: Union[str, None] = "location_management_system"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (インデックス名, テーブル名, カラム名)
+TRGM_INDEXES = [
+    ("ix_locations_name_trgm", "locations", "name"),
+    ("ix_locations_code_trgm", "locations", "code"),
+    ("ix_locations_city_trgm", "locations", "city"),
+    ("ix_locations_address1_trgm", "locations", "address1"),
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_full_name_trgm", "users", "full_name"),
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+    ("ix_users_employee_id_trgm", "users", "employee_id"),
+]
+
+
+def upgrade() -> None:
+    # 1. pg_trgm 拡張の有効化
+    # ※注意: 拡張の作成には権限が必要です。マイグレーション実行ユーザーに権限がない場合は、
+    #   事前にDB管理者が `CREATE EXTENSION IF NOT EXISTS pg_trgm;` を実行してください
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # 2. 検索対象カラムへのGINトライグラムインデックス作成
+    # CONCURRENTLY はトランザクション外でのみ実行可能なため、autocommitブロックで実行する
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in TRGM_INDEXES:
+            op.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                    f"ON {table_name} USING gin ({column_name} gin_trgm_ops)"
+                )
+            )
+
+
+def downgrade() -> None:
+    # 1. トライグラムインデックスの削除
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in reversed(TRGM_INDEXES):
+            op.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+
+    # ※ pg_trgm 拡張は他の用途で使われている可能性があるため削除しない
@@ -0,0 +1,54 @@
+"""
+app/alembic/versions/9d0e1fc00345_location_search_tsvector.py
+
+拠点の全文検索用マイグレーション
+検索対象カラムから生成される tsvector 列と、そのGINインデックスを追加
+"""
+
+"""Location Search Tsvector
+Revision ID: location_search_tsvector
+Revises: search_trigram_indexes
+Create Date: 2025-03-22
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+# revision identifiers, used by Alembic.
+revision: str = "location_search_tsvector"
+down_revision: Union[str, None] = "search_trigram_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 全文検索用の生成列を追加（名前・コード・市区町村・住所1から生成）
+    op.add_column(
+        "locations",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(code, '') || ' ' "
+                "|| coalesce(city, '') || ' ' || coalesce(address1, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+            comment="全文検索用ベクトル",
+        ),
+    )
+
+    # 2. 全文検索用のGINインデックスを作成
+    op.create_index(
+        "ix_locations_search_tsv",
+        "locations",
+        ["search_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    # 1. インデックスと生成列の削除
+    op.drop_index("ix_locations_search_tsv", table_name="locations")
+    op.drop_column("locations", "search_tsv")
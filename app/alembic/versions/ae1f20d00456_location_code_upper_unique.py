@@ -0,0 +1,41 @@
+"""
+app/alembic/versions/ae1f20d00456_location_code_upper_unique.py
+
+拠点コードの大文字小文字を区別しない一意制約のマイグレーション
+upper(code) に対する一意な関数インデックスを追加
+"""
+
+"""Location Code Upper Unique
+Revision ID: location_code_upper_unique
+Revises: location_search_tsvector
+Create Date: 2025-03-22
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "location_code_upper_unique"
+down_revision: Union[str, None] = "location_search_tsvector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 既存データのコードを大文字に正規化
+    # ※注意: 大文字小文字の違いのみで重複するコードが存在する場合、インデックス作成は失敗します。
+    #   事前に重複を解消してください
+    op.execute(text("UPDATE locations SET code = upper(code) WHERE code <> upper(code)"))
+
+    # 2. upper(code) の一意インデックスを作成
+    op.create_index(
+        "ux_locations_code_upper",
+        "locations",
+        [text("upper(code)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    # 1. 関数インデックスの削除
+    op.drop_index("ux_locations_code_upper", table_name="locations")
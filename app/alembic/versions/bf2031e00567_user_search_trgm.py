@@ -0,0 +1,46 @@
+"""
+app/alembic/versions/bf2031e00567_user_search_trgm.py
+
+ユーザー検索用の関数トライグラムインデックスのマイグレーション
+検索対象カラムを連結した式に対するGINインデックスを追加
+"""
+
+"""User Search Trigram Index
+Revision ID: user_search_trgm
+Revises: location_code_upper_unique
+Create Date: 2025-03-23
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "user_search_trgm"
+down_revision: Union[str, None] = "location_code_upper_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/models/user.py の User.search_text() と同一の式（異なるとインデックスが使われない）
+USER_SEARCH_EXPRESSION = (
+    "lower(email || ' ' || coalesce(full_name, '') || ' ' || coalesce(first_name, '') "
+    "|| ' ' || coalesce(last_name, '') || ' ' || coalesce(employee_id, ''))"
+)
+
+
+def upgrade() -> None:
+    # 1. 連結した検索テキストに対するGINトライグラムインデックスを作成
+    # ※ pg_trgm 拡張は search_trigram_indexes マイグレーションで有効化済み
+    with op.get_context().autocommit_block():
+        op.execute(
+            text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_search_trgm "
+                f"ON users USING gin (({USER_SEARCH_EXPRESSION}) gin_trgm_ops)"
+            )
+        )
+
+
+def downgrade() -> None:
+    # 1. インデックスの削除
+    with op.get_context().autocommit_block():
+        op.execute(text("DROP INDEX CONCURRENTLY IF EXISTS ix_users_search_trgm"))
@@ -0,0 +1,72 @@
+"""
+app/alembic/versions/c03142f00678_role_permissions_table.py
+
+ロール権限の正規化マイグレーション
+roles.permissions（JSON文字列）を role_permissions テーブルへ移行
+"""
+
+"""Role Permissions Table
+Revision ID: role_permissions_table
+Revises: user_search_trgm
+Create Date: 2025-03-23
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "role_permissions_table"
+down_revision: Union[str, None] = "user_search_trgm"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. ロール権限テーブルの作成
+    op.create_table(
+        "role_permissions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("role_id", sa.Integer(), nullable=False, comment="ロールID"),
+        sa.Column("permission", sa.String(50), nullable=False, comment="権限"),
+        sa.ForeignKeyConstraint(["role_id"], ["roles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("role_id", "permission", name="uq_role_permissions_role_permission"),
+    )
+    op.create_index(op.f("ix_role_permissions_id"), "role_permissions", ["id"], unique=False)
+
+    # 2. 既存のJSON文字列から権限を移行
+    # ※注意: permissions が不正なJSONのロールが存在する場合は失敗します。事前に修正してください
+    op.execute(
+        text(
+            "INSERT INTO role_permissions (role_id, permission) "
+            "SELECT DISTINCT r.id, p.permission "
+            "FROM roles r, jsonb_array_elements_text(r.permissions::jsonb) AS p(permission) "
+            "WHERE r.permissions IS NOT NULL AND r.permissions <> ''"
+        )
+    )
+
+    # 3. 旧カラムの削除
+    op.drop_column("roles", "permissions")
+
+
+def downgrade() -> None:
+    # 1. 旧カラムの復元
+    op.add_column(
+        "roles",
+        sa.Column("permissions", sa.Text(), nullable=True, comment="権限リスト（JSON文字列）"),
+    )
+
+    # 2. 関連テーブルからJSON文字列へ書き戻し
+    op.execute(
+        text(
+            "UPDATE roles SET permissions = coalesce("
+            "(SELECT json_agg(rp.permission ORDER BY rp.id)::text "
+            "FROM role_permissions rp WHERE rp.role_id = roles.id), '[]')"
+        )
+    )
+    op.alter_column("roles", "permissions", nullable=False)
+
+    # 3. ロール権限テーブルの削除
+    op.drop_index(op.f("ix_role_permissions_id"), table_name="role_permissions")
+    op.drop_table("role_permissions")
@@ -0,0 +1,46 @@
+"""
+app/alembic/versions/d14253000789_user_location_active_indexes.py
+
+現在有効なユーザー所属の検索用インデックスのマイグレーション
+終了日未設定の割り当てに限定した部分インデックスと、終了日のインデックスを追加
+"""
+
+"""User Location Active Indexes
+Revision ID: user_location_active_indexes
+Revises: role_permissions_table
+Create Date: 2025-03-24
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "user_location_active_indexes"
+down_revision: Union[str, None] = "role_permissions_table"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 終了日未設定（現在有効）の割り当てに限定した部分インデックスを作成
+    op.create_index(
+        "ix_user_locations_active",
+        "user_locations",
+        ["user_id", "location_id"],
+        unique=False,
+        postgresql_where=text("end_date IS NULL"),
+    )
+
+    # 2. 終了日が今日以降の割り当て検索用に終了日のインデックスを作成
+    op.create_index(
+        "ix_user_locations_end_date",
+        "user_locations",
+        ["end_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    # 1. インデックスの削除
+    op.drop_index("ix_user_locations_end_date", table_name="user_locations")
+    op.drop_index("ix_user_locations_active", table_name="user_locations")
@@ -0,0 +1,41 @@
+"""
+app/alembic/versions/e25364100890_user_email_lower_unique.py
+
+メールアドレスの大文字小文字を区別しない一意制約のマイグレーション
+既存のメールアドレスを小文字に正規化し、lower(email) に対する一意な関数インデックスを追加
+"""
+
+"""User Email Lower Unique
+Revision ID: user_email_lower_unique
+Revises: user_location_active_indexes
+Create Date: 2025-03-24
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "user_email_lower_unique"
+down_revision: Union[str, None] = "user_location_active_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 既存データのメールアドレスを小文字に正規化
+    # ※注意: 大文字小文字の違いのみで重複するメールアドレスが存在する場合、正規化は失敗します。
+    #   事前に重複を解消してください
+    op.execute(text("UPDATE users SET email = lower(email) WHERE email <> lower(email)"))
+
+    # 2. lower(email) の一意インデックスを作成
+    op.create_index(
+        "ux_users_email_lower",
+        "users",
+        [text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    # 1. 関数インデックスの削除
+    op.drop_index("ux_users_email_lower", table_name="users")
@@ -0,0 +1,50 @@
+"""
+app/alembic/versions/f36475200901_user_location_primary_partial_unique.py
+
+ユーザーの主所属の一意制約を部分一意インデックスへ変更するマイグレーション
+「ユーザーごとに有効な（終了日未設定の）主所属は1件のみ」をデータベース側で保証する
+"""
+
+"""User Location Primary Partial Unique
+Revision ID: user_location_primary_partial_unique
+Revises: user_email_lower_unique
+Create Date: 2025-03-24
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+# revision identifiers, used by Alembic.
+revision: str = "user_location_primary_partial_unique"
+down_revision: Union[str, None] = "user_email_lower_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 既存の一意制約（ユーザー・拠点・主所属フラグの組み合わせ）を削除
+    op.drop_constraint("uq_user_location_primary", "user_locations", type_="unique")
+
+    # 2. 有効な主所属に限定した部分一意インデックスを同じ名前で作成
+    # ※注意: 終了日未設定の主所属を複数持つユーザーが存在する場合、インデックス作成は失敗します。
+    #   事前に重複を解消してください
+    op.create_index(
+        "uq_user_location_primary",
+        "user_locations",
+        ["user_id"],
+        unique=True,
+        postgresql_where=text("is_primary AND end_date IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    # 1. 部分一意インデックスの削除
+    op.drop_index("uq_user_location_primary", table_name="user_locations")
+
+    # 2. 旧一意制約の復元
+    # ※注意: 同じユーザー・拠点・主所属フラグの組み合わせが複数存在する場合は失敗します
+    op.create_unique_constraint(
+        "uq_user_location_primary",
+        "user_locations",
+        ["user_id", "location_id", "is_primary"],
+    )
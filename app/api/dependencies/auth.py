@@ -48,6 +48,8 @@ async def get_current_user(
         raise UnauthorizedException()
         
     # ユーザーの取得
+    # ※ この依存関係の結果はリクエスト内でキャッシュされ、エンドポイント側で同じIDを再取得しても
+    #   セッションの識別マップから返る（UserService.get）ため、ユーザー取得のクエリは1リクエスト1回に収まる
     user = await UserService.get(db, int(token_data.sub))
     if not user:
         raise UnauthorizedException()
@@ -5,7 +5,7 @@ app/api/routes/locations.py
 拠点の管理に関するエンドポイントを提供
 """
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,7 +17,7 @@ from app.models.user import User
 from app.models.location import LocationType
 from app.schemas.location import (
     Location, LocationCreate, LocationUpdate,
-    LocationWithDetails, LocationPage
+    LocationWithDetails, LocationPage, LocationCursorPage
 )
 from app.schemas.user_location import UserLocationPage
 from app.services.location import LocationService
@@ -25,10 +25,11 @@ from app.services.user_location import UserLocationService
 
 router = APIRouter()
 
-@router.get("/", response_model=LocationPage)
+@router.get("/", response_model=Union[LocationPage, LocationCursorPage])
 async def read_locations(
     page: int = Query(1, ge=1, description="ページ番号"),
     size: int = Query(20, ge=1, le=100, description="ページサイズ"),
+    cursor: Optional[str] = Query(None, description="カーソル（指定時はキーセット方式で取得。空文字で先頭ページ）"),
     type: Optional[LocationType] = Query(None, description="拠点タイプでフィルタ"),
     parent_id: Optional[int] = Query(None, description="親拠点IDでフィルタ"),
     is_active: Optional[bool] = Query(None, description="アクティブ状態でフィルタ"),
@@ -40,7 +41,20 @@ async def read_locations(
     """
     拠点一覧を取得（ページネーション、フィルタリング機能付き）
     - READ_LOCATIONS権限が必要
-    """
+    - cursor を指定した場合は、深いページでも高速なキーセット方式で取得
+    """
+    if cursor is not None:
+        return await LocationService.get_page_keyset(
+            db=db,
+            cursor=cursor,
+            size=size,
+            type=type,
+            parent_id=parent_id,
+            is_active=is_active,
+            search=search,
+            prefecture=prefecture,
+        )
+    
     locations_page = await LocationService.get_page(
         db=db,
         page=page,
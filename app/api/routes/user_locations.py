@@ -7,6 +7,7 @@ app/api/routes/user_locations.py
 
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
@@ -15,6 +16,7 @@ from app.core.permissions import has_permission, Permission
 from app.core.exceptions import NotFoundException
 from app.db.session import get_db
 from app.models.user import User
+from app.models.user_location import UserLocation as UserLocationModel
 from app.schemas.user_location import (
     UserLocation, UserLocationCreate, UserLocationUpdate,
     UserLocationWithUser
@@ -154,15 +156,12 @@ async def check_user_location_availability(
     primary_conflicts = []
     if is_primary:
         query = await db.execute(
-            select(UserLocation)
+            select(UserLocationModel)
             .where(
                 and_(
-                    UserLocation.user_id == user_id,
-                    UserLocation.is_primary == True,
-                    or_(
-                        UserLocation.end_date == None,
-                        UserLocation.end_date >= start_date
-                    )
+                    UserLocationModel.user_id == user_id,
+                    UserLocationModel.is_primary == True,
+                    UserLocationModel.active_filter(start_date)
                 )
             )
         )
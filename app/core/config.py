@@ -55,6 +55,13 @@ class Settings(BaseSettings):
     DATABASE_URL: Optional[str] = None
     SYNC_DATABASE_URL: Optional[str] = None
     
+    # コネクションプール設定（ログイン集中時にプール取得待ちで直列化しないよう余裕を持たせる）
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    
     # 管理者ユーザー設定
     FIRST_SUPERUSER_EMAIL: str
     FIRST_SUPERUSER_PASSWORD: str
@@ -1,8 +1,7 @@
 from enum import Enum
-from typing import List, Dict
+from typing import Callable, Dict, FrozenSet
 from fastapi import Depends, HTTPException, status
 
-from app.api.dependencies.auth import get_current_active_user
 from app.core.exceptions import ForbiddenException
 from app.models.user import User
 
@@ -48,6 +47,10 @@ class Permission(str, Enum):
     # 管理者権限
     ADMIN = "admin"
 
+# 全権限の集合と、ロール未設定時の基本権限（モジュール読み込み時に一度だけ構築）
+_ALL_PERMS: FrozenSet[str] = frozenset(p.value for p in Permission)
+_DEFAULT_PERMS: FrozenSet[str] = frozenset((Permission.READ_OWN.value, Permission.WRITE_OWN.value))
+
 # システムロールと関連権限の定義
 SYSTEM_ROLES = {
     "superuser": {
@@ -96,26 +99,29 @@ SYSTEM_ROLES = {
     }
 }
 
-def get_user_permissions(user: User) -> List[str]:
-    """ユーザーの権限リストを取得"""
+def get_user_permissions(user: User) -> FrozenSet[str]:
+    """ユーザーの権限集合を取得"""
     # スーパーユーザーは全権限を持つ
     if user.is_superuser:
-        return [p.value for p in Permission]
+        return _ALL_PERMS
     
     # ロールがない場合は基本権限のみ
-    if not user.role or not user.role.permissions:
-        return [Permission.READ_OWN.value, Permission.WRITE_OWN.value]
+    if not user.role:
+        return _DEFAULT_PERMS
     
-    # JSON文字列から権限リストに変換
-    import json
-    try:
-        return json.loads(user.role.permissions)
-    except json.JSONDecodeError:
-        return [Permission.READ_OWN.value, Permission.WRITE_OWN.value]
+    # ロールに付与された権限集合（権限が1つもない場合は基本権限のみ）
+    return user.role.permission_set or _DEFAULT_PERMS
+
+# Permission ごとに構築済みの依存関係（同一の呼び出し可能オブジェクトを再利用する）
+_perm_deps: Dict[Permission, Callable] = {}
 
-def has_permission(required_permission: Permission):
-    """権限チェック用の依存関係"""
-    def dependency(current_user: User = Depends(get_current_active_user)):
+def _build_dep(required_permission: Permission) -> Callable:
+    """権限チェック用の依存関係を構築"""
+    # 循環インポート回避のため遅延インポート（auth → services → schemas → permissions）
+    from app.api.dependencies.auth import get_current_active_user
+
+    # スレッドプールへのディスパッチを避けるため非同期関数として定義
+    async def dependency(current_user: User = Depends(get_current_active_user)):
         # ユーザーの権限を取得
         user_permissions = get_user_permissions(current_user)
         
@@ -128,4 +134,11 @@ def has_permission(required_permission: Permission):
             raise ForbiddenException(detail=f"Required permission: {required_permission.value}")
             
         return current_user
-    return dependency
\ No newline at end of file
+    return dependency
+
+def has_permission(required_permission: Permission) -> Callable:
+    """権限チェック用の依存関係（Permission ごとに1つだけ構築）"""
+    dependency = _perm_deps.get(required_permission)
+    if dependency is None:
+        dependency = _perm_deps[required_permission] = _build_dep(required_permission)
+    return dependency
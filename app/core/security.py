@@ -1,7 +1,9 @@
 # app/core/security.py
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -9,8 +11,16 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # パスワードハッシュ化のためのパスワードコンテキスト
-# bcryptを使用（安全で広く利用されている）
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 新規ハッシュはArgon2id（OWASP推奨パラメータ: m=46MiB, t=2, p=1）で生成し、
+# 既存のbcryptハッシュは検証のみ対応（ログイン成功時にArgon2idへ再ハッシュする）
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=46 * 1024,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -75,6 +85,19 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    ハッシュが現在のアルゴリズム・パラメータで生成されていないかを判定
+    
+    Args:
+        hashed_password: ハッシュ化されたパスワード
+        
+    Returns:
+        bool: 再ハッシュが必要な場合True
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     パスワードをハッシュ化
@@ -88,6 +111,14 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# 検証済みトークンのキャッシュ（認証付きリクエストごとの署名検証・JSON解析を省略する）
+# sha256(トークン) -> (有効期限, ペイロード)
+# 有効期限はキャッシュのTTLとトークン自身の exp の早い方とし、期限切れのトークンを返さないようにする
+_TOKEN_CACHE_TTL_SECONDS = 30
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     JWTトークンをデコードしてペイロードを取得
@@ -98,8 +129,26 @@ def decode_token(token: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: トークンのペイロード
     """
-    return jwt.decode(
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    entry = _token_cache.get(key)
+    if entry is not None:
+        expires_at, payload = entry
+        if expires_at > now:
+            return dict(payload)
+        _token_cache.pop(key, None)
+    
+    # 検証に失敗した場合は例外がそのまま送出され、キャッシュには格納されない
+    payload = jwt.decode(
         token, 
         settings.SECRET_KEY, 
         algorithms=[settings.ALGORITHM]
-    )
\ No newline at end of file
+    )
+    
+    expires_at = now + _TOKEN_CACHE_TTL_SECONDS
+    if isinstance(payload.get("exp"), (int, float)):
+        expires_at = min(expires_at, payload["exp"])
+    while len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[key] = (expires_at, payload)
+    return dict(payload)
\ No newline at end of file
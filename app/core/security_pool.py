@@ -0,0 +1,72 @@
+# app/core/security_pool.py
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.core.security import get_password_hash, verify_password
+
+# パスワードハッシュ処理用のスレッドプール
+# パスワードハッシュ（Argon2id/bcrypt）はCPU負荷が高く（1回あたり数百ミリ秒）、イベントループ上で実行すると
+# 他のリクエストを全て停止させるため、別スレッドで並列に実行する
+# （どちらもC実装側でGILを解放するため、プロセス間の受け渡しコストがかかるプロセスプールは使わない）
+_WORKERS = os.cpu_count() or 1
+_pool: Optional[ThreadPoolExecutor] = None
+
+# ログイン集中時にプールの待ち行列が伸び続けないよう、同時実行数をプール幅に制限
+_semaphore = asyncio.Semaphore(_WORKERS)
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """
+    スレッドプールを取得（初回呼び出し時に生成）
+
+    Returns:
+        ThreadPoolExecutor: パスワードハッシュ処理用のスレッドプール
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="password-hash")
+    return _pool
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    パスワードをスレッドプールでハッシュ化
+
+    Args:
+        password: 平文パスワード
+
+    Returns:
+        str: ハッシュ化されたパスワード
+    """
+    loop = asyncio.get_running_loop()
+    async with _semaphore:
+        return await loop.run_in_executor(_get_pool(), get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    平文パスワードとハッシュ化されたパスワードをスレッドプールで検証
+
+    Args:
+        plain_password: 平文パスワード
+        hashed_password: ハッシュ化されたパスワード
+
+    Returns:
+        bool: パスワードが一致する場合True
+    """
+    loop = asyncio.get_running_loop()
+    async with _semaphore:
+        return await loop.run_in_executor(_get_pool(), verify_password, plain_password, hashed_password)
+
+
+def shutdown_pool() -> None:
+    """
+    スレッドプールの停止（アプリケーション終了時に呼び出す）
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+import logging
 import time
 from typing import Callable
 
@@ -8,8 +9,11 @@ from app.api.api import api_router
 from app.api.middlewares.jwt import JWTMiddleware
 from app.core.config import settings
 from app.core.exceptions import AppException
+from app.core.security_pool import shutdown_pool
+from app.db.session import engine
 from app.api.routes import auth
 
+logger = logging.getLogger(__name__)
 
 # アプリケーション作成
 
@@ -19,6 +23,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     debug=settings.DEBUG,
+    # レスポンスのJSONエンコードは標準の json より高速な orjson で行う
+    default_response_class=ORJSONResponse,
     description="""
     UniCore API - 次世代のREST APIサーバー
     
@@ -116,7 +122,8 @@ async def startup_event():
     アプリケーション起動時に実行される処理
     """
     # ここでデータベース初期化などの処理を行うことができます
-    pass
+    # コネクションプールの設定値と現在の状態（使用中・待機中・オーバーフロー）を記録
+    logger.info("Database pool: %s", engine.pool.status())
 
 
 # アプリケーション終了時の処理
@@ -125,8 +132,8 @@ async def shutdown_event():
     """
     アプリケーション終了時に実行される処理
     """
-    # ここでリソースのクリーンアップなどを行うことができます
-    pass
+    # パスワードハッシュ処理用のスレッドプールを停止
+    shutdown_pool()
 
 
 # アプリケーション実行
@@ -6,7 +6,8 @@ app/models/location.py
 """
 
 from enum import Enum as PyEnum
-from sqlalchemy import String, Text, Boolean, ForeignKey, Index, DateTime, func, Enum
+from sqlalchemy import String, Text, Boolean, ForeignKey, Index, DateTime, func, Enum, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
@@ -130,6 +131,19 @@ class Location(Base):
         comment="設立日"
     )
     
+    # 全文検索用ベクトル（名前・コード・市区町村・住所1から生成される生成列）
+    # 検索条件でのみ使用するため、通常のSELECTでは読み込まない
+    search_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(code, '') || ' ' "
+            "|| coalesce(city, '') || ' ' || coalesce(address1, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="全文検索用ベクトル"
+    )
+    
     # 監査フィールド
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False,
@@ -146,6 +160,10 @@ class Location(Base):
         Index("ix_locations_address", "prefecture", "city"),
         # 拠点タイプと名前の複合インデックス
         Index("ix_locations_type_name", "type", "name"),
+        # 大文字小文字の違いのみのコード重複を防ぐ関数インデックス
+        Index("ux_locations_code_upper", text("upper(code)"), unique=True),
+        # 全文検索用のGINインデックス
+        Index("ix_locations_search_tsv", "search_tsv", postgresql_using="gin"),
     )
     
     # リレーションシップ
@@ -7,9 +7,10 @@ app/models/role.py
 
 from sqlalchemy import String, Text, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, FrozenSet, TYPE_CHECKING
 
 from app.db.base_class import Base
+from app.models.role_permission import RolePermission
 
 # 型ヒントのための条件付きインポート
 if TYPE_CHECKING:
@@ -25,7 +26,6 @@ class Role(Base):
     description: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True, comment="説明"
     )
-    permissions: Mapped[str] = mapped_column(Text, comment="権限リスト（JSON文字列）")
     is_system_role: Mapped[bool] = mapped_column(
         Boolean, default=False, comment="システム定義ロールかどうか"
     )
@@ -33,12 +33,29 @@ class Role(Base):
     # リレーションシップ
     if TYPE_CHECKING:
         users: Mapped[List["User"]]
+        permission_links: Mapped[List["RolePermission"]]
     else:
         users = relationship(
             "User",
             back_populates="role",
             lazy="selectin",  # コレクションのN+1問題回避
         )
+        permission_links = relationship(
+            "RolePermission",
+            back_populates="role",
+            cascade="all, delete-orphan",
+            lazy="selectin",  # ロール読み込み時に権限も一括取得
+        )
+
+    @property
+    def permissions(self) -> List[str]:
+        """付与されている権限のリスト"""
+        return [link.permission for link in self.permission_links]
+
+    @property
+    def permission_set(self) -> FrozenSet[str]:
+        """付与されている権限の集合（権限チェック用）"""
+        return frozenset(link.permission for link in self.permission_links)
 
     def __repr__(self) -> str:
         return f"<Role {self.name}>"
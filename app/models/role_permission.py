@@ -0,0 +1,46 @@
+"""
+app/models/role_permission.py
+
+ロールと権限の関連を管理するSQLAlchemyデータモデル定義
+ロールごとに付与された権限を1行1権限で保持する
+"""
+
+from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import TYPE_CHECKING
+
+from app.db.base_class import Base
+
+# 型ヒントのための条件付きインポート
+if TYPE_CHECKING:
+    from app.models.role import Role
+
+
+class RolePermission(Base):
+    """ロール権限モデル - SQLAlchemy 2.0の型指定マッピング"""
+
+    __tablename__ = "role_permissions"
+
+    role_id: Mapped[int] = mapped_column(
+        ForeignKey("roles.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="ロールID"
+    )
+    permission: Mapped[str] = mapped_column(
+        String(50), nullable=False,
+        comment="権限"
+    )
+
+    # ユニーク制約：同じロールに同じ権限を重複して付与しない（権限チェックの検索にも使用）
+    __table_args__ = (
+        UniqueConstraint("role_id", "permission", name="uq_role_permissions_role_permission"),
+    )
+
+    # リレーションシップ
+    if TYPE_CHECKING:
+        role: Mapped["Role"]
+    else:
+        role = relationship("Role", back_populates="permission_links")
+
+    def __repr__(self) -> str:
+        return f"<RolePermission {self.role_id}:{self.permission}>"
@@ -5,7 +5,7 @@ app/models/user.py
 ユーザー情報の永続化と関連リレーションシップを管理
 """
 
-from sqlalchemy import Boolean, String, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy import Boolean, String, Text, DateTime, ForeignKey, Index, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime
@@ -103,6 +103,8 @@ class User(Base):
         Index("ix_users_name_search", "last_name", "first_name", "full_name"),
         # 部署と役職用のインデックス
         Index("ix_users_department_position", "department", "position"),
+        # メールアドレスの大文字小文字を区別しない一意制約
+        Index("ux_users_email_lower", text("lower(email)"), unique=True),
     )
 
     # リレーションシップ
@@ -119,5 +121,21 @@ class User(Base):
             "UserLocation", back_populates="user", cascade="all, delete-orphan"
         )
 
+    @classmethod
+    def search_text(cls):
+        """
+        ユーザー検索用の連結テキスト式（メールアドレス・氏名・従業員IDを小文字で連結）
+        ※ マイグレーションの ix_users_search_trgm と同一の式である必要がある（区切り文字はリテラルとして埋め込む）
+        """
+        sep = literal_column("' '")
+        empty = literal_column("''")
+        return func.lower(
+            cls.email
+            + sep + func.coalesce(cls.full_name, empty)
+            + sep + func.coalesce(cls.first_name, empty)
+            + sep + func.coalesce(cls.last_name, empty)
+            + sep + func.coalesce(cls.employee_id, empty)
+        )
+
     def __repr__(self) -> str:
         return f"<User {self.email}>"
\ No newline at end of file
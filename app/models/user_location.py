@@ -5,7 +5,7 @@ app/models/user_location.py
 ユーザーの拠点への割り当て・異動履歴を管理する
 """
 
-from sqlalchemy import ForeignKey, Boolean, String, Date, UniqueConstraint, func
+from sqlalchemy import ForeignKey, Boolean, String, Date, Index, func, or_, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 from datetime import date, datetime
@@ -72,9 +72,16 @@ class UserLocation(Base):
         comment="更新日時"
     )
     
-    # ユニーク制約：同じユーザーと拠点の組み合わせで有効期間が重複しないようにする
+    # ユニーク制約：ユーザーごとに有効な（終了日未設定の）主所属は1件のみ
     __table_args__ = (
-        UniqueConstraint('user_id', 'location_id', 'is_primary', name='uq_user_location_primary'),
+        Index(
+            "uq_user_location_primary", "user_id",
+            unique=True, postgresql_where=text("is_primary AND end_date IS NULL")
+        ),
+        # 現在有効な割り当て（終了日未設定）の検索用部分インデックス
+        Index("ix_user_locations_active", "user_id", "location_id", postgresql_where=text("end_date IS NULL")),
+        # 終了日が今日以降の割り当て検索用インデックス
+        Index("ix_user_locations_end_date", "end_date"),
     )
     
     # リレーションシップ
@@ -85,5 +92,13 @@ class UserLocation(Base):
         user = relationship("User", back_populates="locations")
         location = relationship("Location", back_populates="users")
         
+    @classmethod
+    def active_filter(cls, on: Optional[date] = None):
+        """
+        指定日（省略時は今日）時点で有効な割り当て（終了日が未設定か指定日以降）の条件式
+        """
+        on = on or date.today()
+        return or_(cls.end_date.is_(None), cls.end_date >= on)
+        
     def __repr__(self) -> str:
         return f"<UserLocation {self.user_id}@{self.location_id}>"
\ No newline at end of file
@@ -5,7 +5,9 @@ app/schemas/base.py
 ファイル内で再利用可能な基本設定と共通機能を提供
 """
 
-from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Any, Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 class BaseSchema(BaseModel):
     """共通の基本スキーマ設定"""
@@ -14,4 +16,38 @@ class BaseSchema(BaseModel):
         extra="forbid",
         str_strip_whitespace=True,  # 文字列の前後の空白を自動除去
         validate_assignment=True,   # 属性代入時もバリデーション
-    )
\ No newline at end of file
+    )
+
+
+def make_partial(
+    name: str,
+    base: type[BaseModel],
+    *,
+    mixin: type[BaseSchema] = BaseSchema,
+    exclude: Iterable[str] = (),
+    doc: Optional[str] = None,
+) -> type[BaseSchema]:
+    """
+    既存スキーマの全フィールドを任意（デフォルトNone）にした更新用スキーマを生成
+
+    Args:
+        name: 生成するスキーマのクラス名
+        base: フィールド定義の元となるスキーマ
+        mixin: 継承元クラス（追加フィールドや手書きのバリデータを定義する）
+        exclude: 生成対象から除外するフィールド名
+        doc: 生成するスキーマのdocstring
+
+    Returns:
+        type[BaseSchema]: 生成された更新用スキーマ
+    """
+    excluded = set(exclude)
+    fields: Dict[str, Tuple[Any, Any]] = {}
+    for key, f in base.model_fields.items():
+        if key in excluded:
+            continue
+        annotation: Any = Optional[f.annotation]
+        # 制約（min_length, ge, pattern など）はmetadataとして引き継ぐ
+        if f.metadata:
+            annotation = Annotated[annotation, *f.metadata]
+        fields[key] = (annotation, Field(None, title=f.title))
+    return create_model(name, __base__=mixin, __doc__=doc, __module__=base.__module__, **fields)
@@ -5,12 +5,12 @@ app/schemas/location.py
 API入出力のバリデーションとシリアライズを管理
 """
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from datetime import datetime, date
-from typing import Optional, List, Union
+from pydantic import Field, field_validator, ConfigDict
+from datetime import datetime
+from typing import Optional, List
 from app.models.location import LocationType
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, make_partial
 
 # 拠点の基本情報
 class LocationBase(BaseSchema):
@@ -53,32 +53,12 @@ class LocationCreate(LocationBase):
     """拠点作成リクエスト"""
     pass
 
-# 拠点更新リクエスト
-class LocationUpdate(BaseSchema):
-    """拠点更新リクエスト"""
-    name: Optional[str] = Field(None, title="拠点名")
-    code: Optional[str] = Field(None, title="拠点コード", pattern="^[A-Za-z0-9\\-_]{2,20}$")
-    type: Optional[LocationType] = Field(None, title="拠点タイプ")
-    parent_id: Optional[int] = Field(None, title="親拠点ID")
-    postal_code: Optional[str] = Field(None, title="郵便番号")
-    prefecture: Optional[str] = Field(None, title="都道府県")
-    city: Optional[str] = Field(None, title="市区町村")
-    address1: Optional[str] = Field(None, title="住所1")
-    address2: Optional[str] = Field(None, title="住所2")
-    phone: Optional[str] = Field(None, title="電話番号")
-    fax: Optional[str] = Field(None, title="FAX番号")
-    email: Optional[str] = Field(None, title="メールアドレス")
-    business_hours: Optional[str] = Field(None, title="営業時間")
-    description: Optional[str] = Field(None, title="説明")
-    manager_name: Optional[str] = Field(None, title="管理者名")
-    capacity: Optional[int] = Field(None, ge=0, title="収容人数")
-    is_active: Optional[bool] = Field(None, title="アクティブ状態")
-    latitude: Optional[float] = Field(None, title="緯度")
-    longitude: Optional[float] = Field(None, title="経度")
-    established_date: Optional[datetime] = Field(None, title="設立日")
+# 拠点更新リクエストのバリデータ（フィールドは LocationBase から生成）
+class _LocationUpdateValidators(BaseSchema):
+    """拠点更新リクエストの手書きバリデータ"""
 
     # 拠点コードのバリデーション（LocationBaseと同じ）
-    @field_validator('code')
+    @field_validator('code', check_fields=False)
     @classmethod
     def validate_code(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
@@ -89,6 +69,14 @@ class LocationUpdate(BaseSchema):
             raise ValueError("拠点コードには英数字、ハイフン、アンダースコアのみ使用できます")
         return v.upper()  # 常に大文字に正規化
 
+# 拠点更新リクエスト
+LocationUpdate = make_partial(
+    "LocationUpdate",
+    LocationBase,
+    mixin=_LocationUpdateValidators,
+    doc="拠点更新リクエスト",
+)
+
 # データベース内の拠点基本情報
 class LocationInDBBase(LocationBase):
     """データベース内の拠点情報"""
@@ -117,4 +105,11 @@ class LocationPage(BaseSchema):
     total: int = Field(..., title="総件数")
     page: int = Field(..., title="現在のページ")
     size: int = Field(..., title="ページサイズ")
-    pages: int = Field(..., title="総ページ数")
\ No newline at end of file
+    pages: int = Field(..., title="総ページ数")
+
+# 拠点一覧カーソルページネーション（キーセット方式）
+class LocationCursorPage(BaseSchema):
+    """カーソル（キーセット）ページネーション付き拠点一覧"""
+    items: List[Location] = Field(..., title="拠点リスト")
+    size: int = Field(..., title="ページサイズ")
+    next_cursor: Optional[str] = Field(None, title="次ページのカーソル")
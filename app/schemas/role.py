@@ -8,7 +8,7 @@ app/schemas/role.py
 from pydantic import Field, field_validator, ConfigDict
 from typing import Optional, List
 from app.core.permissions import Permission
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, make_partial
 
 # キャッシュ: 定義されている権限の集合を一度だけ計算しておく
 _VALID_PERMISSIONS: set[str] = {p.value for p in Permission}
@@ -26,6 +26,8 @@ class RoleBase(BaseSchema):
     @field_validator("permissions")
     @classmethod
     def validate_permissions(cls, v: List[str]) -> List[str]:
+        if not v:
+            return v
         for perm in v:
             if perm not in _VALID_PERMISSIONS:
                 raise ValueError(f"無効な権限です: {perm}")
@@ -38,18 +40,14 @@ class RoleCreate(RoleBase):
     pass
 
 
-class RoleUpdate(BaseSchema):
-    """ロール更新リクエスト"""
+class _RoleUpdateValidators(BaseSchema):
+    """ロール更新リクエストの手書きバリデータ"""
     model_config = ConfigDict(from_attributes=True)
 
-    name: Optional[str] = Field(None, title="ロール名")
-    description: Optional[str] = Field(None, title="説明")
-    permissions: Optional[List[str]] = Field(None, title="権限リスト")
-
-    @field_validator("permissions")
+    @field_validator("permissions", check_fields=False)
     @classmethod
     def validate_permissions(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        if v is None:
+        if not v:
             return v
         for perm in v:
             if perm not in _VALID_PERMISSIONS:
@@ -57,6 +55,15 @@ class RoleUpdate(BaseSchema):
         return v
 
 
+# ロール更新リクエスト（フィールドは RoleBase から生成）
+RoleUpdate = make_partial(
+    "RoleUpdate",
+    RoleBase,
+    mixin=_RoleUpdateValidators,
+    doc="ロール更新リクエスト",
+)
+
+
 class RoleInDBBase(RoleBase):
     """データベース内のロール情報の基本クラス"""
     id: int = Field(..., title="ロールID")
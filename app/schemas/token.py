@@ -5,15 +5,19 @@ app/schemas/token.py
 JWTトークンのペイロードなど、認証情報のスキーマを管理します。
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field, ConfigDict
 
 class Token(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     access_token: str = Field(..., title="アクセストークン")
+    refresh_token: Optional[str] = Field(None, title="リフレッシュトークン")
     token_type: str = Field(..., title="トークンタイプ")
 
 class TokenPayload(BaseModel):
     model_config = ConfigDict(from_attributes=True)
-    sub: str = Field(..., title="サブジェクト")
-    exp: int = Field(..., title="有効期限 (UNIXタイムスタンプ)")
-    # もしトークンタイプのフィールドが必要なら追加可能（例: type: str）
\ No newline at end of file
+    # 内部でのみ使用するスキーマのため、Fieldメタデータは付けずに型注釈のみとする
+    sub: str  # サブジェクト
+    exp: int  # 有効期限 (UNIXタイムスタンプ)
+    type: Optional[str] = None  # トークン種別（"access" / "refresh"）
\ No newline at end of file
@@ -6,10 +6,24 @@ app/schemas/user.py
 """
 
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Optional
 from pydantic import EmailStr, Field, HttpUrl, field_validator, ConfigDict
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, make_partial
+
+
+def _build_full_name(first: Optional[str], last: Optional[str]) -> Optional[str]:
+    """姓・名から氏名を組み立てる（どちらも空の場合は None）"""
+    if last and first:
+        return f"{last} {first}"
+    if last:
+        return last
+    return first or None
+
+
+def _normalize_email(email: Optional[str]) -> Optional[str]:
+    """メールアドレスを前後空白除去・小文字に正規化（大文字小文字違いの重複登録を防ぐ）"""
+    return email.strip().lower() if email is not None else None
 
 
 class UserBase(BaseSchema):
@@ -53,54 +67,54 @@ class UserCreate(BaseSchema):
     date_of_birth: Optional[datetime] = Field(None, title="生年月日")
     hire_date: Optional[datetime] = Field(None, title="入社日")
     
+    # メールアドレスの正規化
+    @field_validator('email')
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        return _normalize_email(v)
+    
     # 氏名の自動生成：full_nameが明示的に設定されていない場合、first_nameとlast_nameから生成
     @field_validator('full_name', mode='before')
     @classmethod
     def generate_full_name(cls, v: Optional[str], info) -> Optional[str]:
         if v is None:
             values = info.data
-            first = values.get('first_name', '')
-            last = values.get('last_name', '')
-            if first or last:
-                return f"{last or ''} {first or ''}".strip()
+            return _build_full_name(values.get('first_name'), values.get('last_name'))
         return v
 
 
-class UserUpdate(BaseSchema):
-    """ユーザー更新リクエスト"""
+class _UserUpdateFields(BaseSchema):
+    """ユーザー更新リクエスト固有のフィールドと手書きバリデータ"""
     model_config = ConfigDict(from_attributes=True)
     
-    email: Optional[EmailStr] = Field(None, title="メールアドレス")
-    first_name: Optional[str] = Field(None, title="名")
-    last_name: Optional[str] = Field(None, title="姓")
-    full_name: Optional[str] = Field(None, title="氏名")
     password: Optional[str] = Field(None, min_length=8, max_length=100, title="パスワード")
-    is_active: Optional[bool] = Field(None, title="アクティブ状態")
     is_superuser: Optional[bool] = Field(None, title="管理者権限")
-    role_id: Optional[int] = Field(None, title="ロールID")
-    department: Optional[str] = Field(None, title="部署")
-    position: Optional[str] = Field(None, title="役職")
-    employee_id: Optional[str] = Field(None, title="従業員ID")
-    phone: Optional[str] = Field(None, title="電話番号")
-    mobile_phone: Optional[str] = Field(None, title="携帯電話番号")
-    address: Optional[str] = Field(None, title="住所")
-    profile_image_url: Optional[HttpUrl] = Field(None, title="プロフィール画像URL")
-    date_of_birth: Optional[datetime] = Field(None, title="生年月日")
-    hire_date: Optional[datetime] = Field(None, title="入社日")
+    
+    # UserCreate と同様のメールアドレス正規化
+    @field_validator('email', check_fields=False)
+    @classmethod
+    def normalize_email(cls, v: Optional[str]) -> Optional[str]:
+        return _normalize_email(v)
     
     # UserCreate と同様の氏名自動生成バリデーション
-    @field_validator('full_name', mode='before')
+    @field_validator('full_name', mode='before', check_fields=False)
     @classmethod
     def generate_full_name(cls, v: Optional[str], info) -> Optional[str]:
         if v is None:
             values = info.data
-            first = values.get('first_name', '')
-            last = values.get('last_name', '')
-            if first or last:
-                return f"{last or ''} {first or ''}".strip()
+            return _build_full_name(values.get('first_name'), values.get('last_name'))
         return v
 
 
+# ユーザー更新リクエスト（プロフィール項目は UserBase から生成）
+UserUpdate = make_partial(
+    "UserUpdate",
+    UserBase,
+    mixin=_UserUpdateFields,
+    doc="ユーザー更新リクエスト",
+)
+
+
 class UserInDBBase(UserBase):
     """データベース内のユーザー情報の基本クラス"""
     model_config = ConfigDict(from_attributes=True)
@@ -9,7 +9,7 @@ from pydantic import Field, field_validator
 from datetime import date, datetime
 from typing import Optional, List
 
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, make_partial
 from app.schemas.user import User
 
 # ユーザー所属の基本情報
@@ -39,18 +39,12 @@ class UserLocationCreate(UserLocationBase):
     """ユーザー所属作成リクエスト"""
     start_date: date = Field(default_factory=date.today, title="所属開始日")
 
-# ユーザー所属更新リクエスト
-class UserLocationUpdate(BaseSchema):
-    """ユーザー所属更新リクエスト"""
-    is_primary: Optional[bool] = Field(None, title="主所属かどうか")
-    position: Optional[str] = Field(None, title="拠点内での役職")
-    department: Optional[str] = Field(None, title="拠点内での部署")
-    start_date: Optional[date] = Field(None, title="所属開始日")
-    end_date: Optional[date] = Field(None, title="所属終了日")
-    notes: Optional[str] = Field(None, title="備考")
+# ユーザー所属更新リクエストのバリデータ（フィールドは UserLocationBase から生成）
+class _UserLocationUpdateValidators(BaseSchema):
+    """ユーザー所属更新リクエストの手書きバリデータ"""
 
     # 日付バリデーション
-    @field_validator('end_date')
+    @field_validator('end_date', check_fields=False)
     @classmethod
     def validate_end_date(cls, v: Optional[date], info):
         if v is not None:
@@ -59,6 +53,15 @@ class UserLocationUpdate(BaseSchema):
                 raise ValueError("終了日は開始日より後である必要があります")
         return v
 
+# ユーザー所属更新リクエスト（ユーザーIDと拠点IDは変更不可）
+UserLocationUpdate = make_partial(
+    "UserLocationUpdate",
+    UserLocationBase,
+    mixin=_UserLocationUpdateValidators,
+    exclude=("user_id", "location_id"),
+    doc="ユーザー所属更新リクエスト",
+)
+
 # データベース内のユーザー所属情報
 class UserLocationInDBBase(UserLocationBase):
     """データベース内のユーザー所属情報"""
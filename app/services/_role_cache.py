@@ -0,0 +1,127 @@
+"""
+app/services/_role_cache.py
+
+ロール情報のプロセス内キャッシュ
+role_id をキーに、有効期限付きでロールを保持し、ユーザー取得時のロール再取得を省略する
+※ キャッシュには特定のリクエストのセッションに属さない（切り離された）インスタンスのみを保持し、
+  呼び出し元へは merge(load=False) で呼び出し元のセッションに取り込んだインスタンスを返す
+"""
+
+import asyncio
+import time
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+from sqlalchemy.orm.util import identity_key
+
+from app.models.role import Role
+
+# キャッシュの有効期限（秒）と最大件数
+_TTL_SECONDS = 60
+_MAX_SIZE = 256
+
+# 未キャッシュのロールを取得する際の IN 句1回あたりの件数
+_IN_BATCH_SIZE = 500
+
+# role_id -> (有効期限, セッションから切り離されたロール)
+_cache: Dict[int, Tuple[float, Role]] = {}
+_lock = asyncio.Lock()
+
+
+def _lookup(role_id: int, now: float) -> Optional[Role]:
+    """有効期限内のキャッシュ済みロールを返す（期限切れの場合は破棄してNone）"""
+    entry = _cache.get(role_id)
+    if entry is None:
+        return None
+    expires_at, role = entry
+    if expires_at <= now:
+        _cache.pop(role_id, None)
+        return None
+    return role
+
+
+def _store(role: Role, now: float) -> None:
+    """ロールをキャッシュに格納（上限に達した場合は最も古いエントリから破棄）"""
+    while len(_cache) >= _MAX_SIZE:
+        _cache.pop(next(iter(_cache)))
+    _cache[role.id] = (now + _TTL_SECONDS, role)
+
+
+async def _load_detached(db: AsyncSession, role_ids: List[int]) -> List[Role]:
+    """
+    ロールを呼び出し元とは別の一時セッションで読み込み、セッションから切り離した状態で返す
+    （呼び出し元セッションの識別マップ上のインスタンスをキャッシュに持ち出さないため。接続・トランザクションは呼び出し元と共有）
+    """
+    roles: List[Role] = []
+    async with AsyncSession(bind=await db.connection()) as loader:
+        # バインドパラメータ数の上限を超えないよう、IN句は一定件数ごとに分割して取得
+        ids = iter(role_ids)
+        while batch := list(islice(ids, _IN_BATCH_SIZE)):
+            # ロールに紐づくユーザー一覧はキャッシュ対象外のため読み込まない
+            # （未ロードのまま切り離すことで、merge 時に呼び出し元セッションの値を上書きしない）
+            result = await loader.execute(
+                select(Role).options(lazyload(Role.users)).where(Role.id.in_(batch))
+            )
+            roles.extend(result.scalars().all())
+    # セッションを閉じた時点で各ロール（および権限の紐付け）は切り離される
+    return roles
+
+
+async def _attach(db: AsyncSession, role: Role) -> Role:
+    """キャッシュ済みのロールを呼び出し元のセッションに取り込んで返す（共有インスタンスそのものは返さない）"""
+    # 呼び出し元セッションで既に読み込まれている場合は、そのインスタンスを優先する
+    existing = db.sync_session.identity_map.get(identity_key(Role, role.id))
+    if existing is not None:
+        return existing
+    return await db.merge(role, load=False)
+
+
+async def get_roles(db: AsyncSession, role_ids: Iterable[int]) -> Dict[int, Role]:
+    """
+    複数ロールをまとめて取得（キャッシュにないものだけを1回のINクエリで取得）
+
+    Args:
+        db: データベースセッション
+        role_ids: ロールIDの集合
+
+    Returns:
+        Dict[int, Role]: role_id をキーとした、呼び出し元セッションのロールの辞書（存在しないIDは含まない）
+    """
+    now = time.monotonic()
+    roles: Dict[int, Role] = {}
+    missing = []
+    for role_id in set(role_ids):
+        role = _lookup(role_id, now)
+        if role is None:
+            missing.append(role_id)
+        else:
+            roles[role_id] = await _attach(db, role)
+
+    if missing:
+        async with _lock:
+            for role in await _load_detached(db, missing):
+                _store(role, now)
+                roles[role.id] = await _attach(db, role)
+
+    return roles
+
+
+async def get_role(db: AsyncSession, role_id: int) -> Optional[Role]:
+    """
+    単一ロールの取得（キャッシュ優先）
+    """
+    roles = await get_roles(db, (role_id,))
+    return roles.get(role_id)
+
+
+def invalidate(role_id: Optional[int] = None) -> None:
+    """
+    キャッシュの無効化（role_id 未指定の場合は全件）
+    """
+    if role_id is None:
+        _cache.clear()
+    else:
+        _cache.pop(role_id, None)
@@ -0,0 +1,48 @@
+"""
+app/services/_user_cache.py
+
+メールアドレスによるユーザー取得のプロセス内キャッシュ
+ログイン等で繰り返される同一ユーザーの検索について、メールアドレスからユーザーIDへの対応を有効期限付きで保持する
+※ ORMインスタンスは読み込んだリクエストのセッションに属するため保持しない
+  （ユーザー本体は呼び出し元のセッションで主キー取得する）
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+# キャッシュの有効期限（秒）と最大件数
+# ※ 複数ワーカー間では無効化が伝播しないため、有効期限は短く保つ
+_TTL_SECONDS = 30
+_MAX_SIZE = 4096
+
+# email -> (有効期限, ユーザーID)
+_cache: Dict[str, Tuple[float, int]] = {}
+
+
+def get(email: str) -> Optional[int]:
+    """有効期限内のキャッシュ済みユーザーIDを返す（期限切れの場合は破棄してNone）"""
+    entry = _cache.get(email)
+    if entry is None:
+        return None
+    expires_at, user_id = entry
+    if expires_at <= time.monotonic():
+        _cache.pop(email, None)
+        return None
+    return user_id
+
+
+def store(email: str, user_id: int) -> None:
+    """メールアドレスとユーザーIDの対応をキャッシュに格納（上限に達した場合は最も古いエントリから破棄）"""
+    while len(_cache) >= _MAX_SIZE:
+        _cache.pop(next(iter(_cache)))
+    _cache[email] = (time.monotonic() + _TTL_SECONDS, user_id)
+
+
+def invalidate(email: Optional[str] = None) -> None:
+    """
+    キャッシュの無効化（email 未指定の場合は全件）
+    """
+    if email is None:
+        _cache.clear()
+    else:
+        _cache.pop(email, None)
@@ -1,12 +1,16 @@
 from typing import Any, Dict, Optional, Union, List, Tuple
 
-from sqlalchemy import select, update, delete, func
+from pydantic import TypeAdapter
+from sqlalchemy import select, insert, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, load_only, raiseload
 
 from app.core.exceptions import NotFoundException
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemUpdate, ItemPage
+from app.schemas.item import Item as ItemSchema, ItemCreate, ItemUpdate, ItemPage
+
+# ページ内アイテムの変換用アダプタ（モジュール読み込み時に一度だけ構築）
+_ITEM_LIST_ADAPTER = TypeAdapter(List[ItemSchema])
 
 
 class ItemService:
@@ -54,20 +58,32 @@ class ItemService:
         Returns:
             Tuple[List[Item], int]: アイテムリストと総数のタプル
         """
-        # クエリ構築
-        query = select(Item)
-        
-        # フィルタが指定されている場合は適用
+        # フィルタ条件を構築（一覧取得と総数取得で共有）
+        conditions = []
         if owner_id is not None:
-            query = query.where(Item.owner_id == owner_id)
+            conditions.append(Item.owner_id == owner_id)
+        
+        query = select(Item).where(*conditions)
             
-        # 総数取得
-        count_query = select(func.count()).select_from(query.subquery())
+        # 総数取得（サブクエリを介さず同じWHERE句で直接カウント）
+        count_query = select(func.count()).select_from(Item).where(*conditions)
         total = await db.execute(count_query)
         total_count = total.scalar_one()
         
         # ページネーション適用
-        items_query = query.offset(skip).limit(limit)
+        # 一覧ではレスポンススキーマが公開するカラムのみ取得し、ownerは読み込まない
+        items_query = (
+            query
+            .options(
+                load_only(
+                    Item.id, Item.title, Item.description, Item.owner_id,
+                    Item.created_at, Item.updated_at,
+                ),
+                raiseload(Item.owner),
+            )
+            .offset(skip)
+            .limit(limit)
+        )
         result = await db.execute(items_query)
         items = result.scalars().all()
         
@@ -98,6 +114,35 @@ class ItemService:
         await db.refresh(db_obj)
         return db_obj
     
+    @staticmethod
+    async def bulk_create(db: AsyncSession, objs_in: List[ItemCreate], owner_id: int) -> List[Item]:
+        """
+        アイテムの一括作成
+        
+        Args:
+            db: データベースセッション
+            objs_in: 作成するアイテム情報のリスト
+            owner_id: オーナーID
+            
+        Returns:
+            List[Item]: 作成されたアイテムのリスト（入力と同じ順序）
+        """
+        if not objs_in:
+            return []
+        
+        # 1件ずつ INSERT + refresh せず、複数行の INSERT ... RETURNING でまとめて作成
+        rows = [
+            {"title": obj_in.title, "description": obj_in.description, "owner_id": owner_id}
+            for obj_in in objs_in
+        ]
+        result = await db.scalars(
+            insert(Item).returning(Item, sort_by_parameter_order=True),
+            rows,
+        )
+        items = result.all()
+        await db.commit()
+        return items
+    
     @staticmethod
     async def update(
         db: AsyncSession, 
@@ -199,8 +244,9 @@ class ItemService:
         pages = (total + size - 1) // size  # 切り上げ
         
         # レスポンス構築
-        return ItemPage(
-            items=items,
+        # DB由来の値は検証済みのため、ページ外枠はバリデーションを省略して構築する
+        return ItemPage.model_construct(
+            items=_ITEM_LIST_ADAPTER.validate_python(items, from_attributes=True),
             total=total,
             page=page,
             size=size,
@@ -5,16 +5,50 @@ app/services/location.py
 拠点のCRUD操作と関連する業務ルールを実装
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple
-from sqlalchemy import select, update, delete, func, text, and_, or_
+import base64
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy import select, insert, update, delete, func, text, and_, or_, tuple_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import ConflictException, NotFoundException, BadRequestException
 from app.models.location import Location, LocationType
 from app.models.user_location import UserLocation
-from app.schemas.location import LocationCreate, LocationUpdate, LocationPage
+from app.schemas.location import (
+    Location as LocationSchema, LocationCreate, LocationUpdate, LocationPage, LocationCursorPage
+)
+
+# 全文検索の語として扱う文字列（tsquery の演算子を含まない）と、LIKE のワイルドカード
+_SEARCH_WORD_RE = re.compile(r"[^\W_]+")
+_LIKE_WILDCARDS = ("%", "_")
+
+# ページ内拠点の変換用アダプタ（モジュール読み込み時に一度だけ構築）
+_LOCATION_LIST_ADAPTER = TypeAdapter(List[LocationSchema])
+
+
+def _optional_eq(column: Any, value: Any, name: str) -> Any:
+    """値がNoneの場合は常に真となる等価条件 (:name IS NULL OR column = :name) を構築"""
+    param = bindparam(name, value, type_=column.type)
+    return or_(param.is_(None), column == param)
+
+
+def _encode_cursor(location: Location) -> str:
+    """拠点の並び順キー (type, name, id) をカーソル文字列に変換"""
+    key = [location.type.value, location.name, location.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[LocationType, str, int]:
+    """カーソル文字列を並び順キー (type, name, id) に復元"""
+    try:
+        type_value, name, location_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return LocationType(type_value), str(name), int(location_id)
+    except (ValueError, TypeError):
+        raise BadRequestException(detail="カーソルの形式が不正です")
 
 class LocationService:
     """
@@ -38,7 +72,7 @@ class LocationService:
         result = await db.execute(
             select(Location)
             .options(
-                joinedload(Location.parent),
+                selectinload(Location.parent),
                 selectinload(Location.children),
                 selectinload(Location.users)
             )
@@ -58,13 +92,13 @@ class LocationService:
         Returns:
             Optional[Location]: 見つかった拠点、見つからない場合はNone
         """
-        # 常に大文字に正規化
+        # パスパラメータ等のスキーマを経由しない入力のため、ここで大文字に正規化
         normalized_code = code.upper()
         
         result = await db.execute(
             select(Location)
             .options(
-                joinedload(Location.parent),
+                selectinload(Location.parent),
                 selectinload(Location.children)
             )
             .where(Location.code == normalized_code)
@@ -101,44 +135,23 @@ class LocationService:
         # クエリ構築
         query = select(Location)
         
-        # フィルタリング条件を適用
-        filters = []
-        if type is not None:
-            filters.append(Location.type == type)
-            
-        if parent_id is not None:
-            filters.append(Location.parent_id == parent_id)
-            
-        if is_active is not None:
-            filters.append(Location.is_active == is_active)
-            
-        if prefecture is not None:
-            filters.append(Location.prefecture == prefecture)
-            
-        if search:
-            search_term = f"%{search}%"
-            filters.append(
-                or_(
-                    Location.name.ilike(search_term),
-                    Location.code.ilike(search_term),
-                    Location.city.ilike(search_term),
-                    Location.address1.ilike(search_term)
-                )
-            )
+        # フィルタリング条件を構築
+        filters = LocationService._build_filters(
+            type=type,
+            parent_id=parent_id,
+            is_active=is_active,
+            search=search,
+            prefecture=prefecture,
+        )
         
         # フィルタ条件を適用
         if filters:
             query = query.where(and_(*filters))
-            
-        # 総数取得
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await db.execute(count_query)
-        total_count = total.scalar_one()
         
         # ページネーション適用とリレーションシップのロード
         items_query = (
             query
-            .options(joinedload(Location.parent))
+            .options(selectinload(Location.parent), raiseload("*"))  # 想定外の遅延ロード（N+1）は即座にエラー
             .order_by(Location.type, Location.name)
             .offset(skip)
             .limit(limit)
@@ -147,8 +160,113 @@ class LocationService:
         result = await db.execute(items_query)
         locations = result.scalars().all()
         
+        # 取得件数が上限未満なら、これが最終ページのため総数は計算で求まる（COUNTを省略）
+        if len(locations) < limit and (locations or skip == 0):
+            return locations, skip + len(locations)
+        
+        # 総数取得（サブクエリで包まず、同じ条件を直接適用して集計）
+        count_query = select(func.count(Location.id))
+        if filters:
+            count_query = count_query.where(and_(*filters))
+        total = await db.execute(count_query)
+        total_count = total.scalar_one()
+        
         return locations, total_count
     
+    @staticmethod
+    def _build_filters(
+        type: Optional[LocationType] = None,
+        parent_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        prefecture: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        一覧取得用のフィルタリング条件を構築
+        
+        Returns:
+            List[Any]: WHERE句に適用する条件のリスト
+        """
+        # 等価条件は値の有無に関わらず常に同じ形のSQLとし、
+        # プリペアドステートメントのキャッシュをフィルタの組み合わせ間で共有する
+        filters = [
+            _optional_eq(Location.type, type, "type_filter"),
+            _optional_eq(Location.parent_id, parent_id, "parent_id_filter"),
+            _optional_eq(Location.is_active, is_active, "is_active_filter"),
+            _optional_eq(Location.prefecture, prefecture, "prefecture_filter"),
+        ]
+            
+        if search:
+            # 部分一致検索はトライグラムインデックスを使うILIKEで判定
+            # （'simple' パーサは日本語を語に分割せず、語の途中の文字列にも一致しないため、全文検索だけでは置き換えられない）
+            search_term = f"%{search}%"
+            substring_match = or_(
+                Location.name.ilike(search_term),
+                Location.code.ilike(search_term),
+                Location.city.ilike(search_term),
+                Location.address1.ilike(search_term)
+            )
+            words = _SEARCH_WORD_RE.findall(search)
+            if words and not any(c in search for c in _LIKE_WILDCARDS):
+                # 語単位の検索は全文検索インデックス（search_tsv）での各語の前方一致も加え、
+                # 離れた位置・別の列にある複数語の組み合わせにも一致させる
+                ts_query = " & ".join(f"{word}:*" for word in words)
+                filters.append(
+                    or_(
+                        Location.search_tsv.op("@@")(func.to_tsquery("simple", ts_query)),
+                        substring_match,
+                    )
+                )
+            else:
+                filters.append(substring_match)
+        
+        return filters
+    
+    @staticmethod
+    async def iter_multi(
+        db: AsyncSession,
+        type: Optional[LocationType] = None,
+        parent_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        prefecture: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Location]:
+        """
+        条件に一致する全拠点をサーバーサイドカーソルで逐次取得（一括エクスポート向け）
+        
+        結果全体をメモリに展開せず、batch_size 件ずつ取得しながら返す
+        
+        Args:
+            db: データベースセッション
+            type: 拠点タイプによるフィルタリング
+            parent_id: 親拠点IDによるフィルタリング
+            is_active: アクティブステータスによるフィルタリング
+            search: 名前またはコードによる検索
+            prefecture: 都道府県によるフィルタリング
+            batch_size: 1回のフェッチで取得する件数
+            
+        Yields:
+            Location: 拠点
+        """
+        filters = LocationService._build_filters(
+            type=type,
+            parent_id=parent_id,
+            is_active=is_active,
+            search=search,
+            prefecture=prefecture,
+        )
+        query = (
+            select(Location)
+            .where(*filters)
+            .options(raiseload("*"))
+            .order_by(Location.type, Location.name)
+            .execution_options(yield_per=batch_size)
+        )
+        
+        async for location in await db.stream_scalars(query):
+            yield location
+    
     @staticmethod
     async def create(db: AsyncSession, obj_in: LocationCreate) -> Location:
         """
@@ -167,19 +285,18 @@ class LocationService:
         """
         # 親拠点の存在確認
         if obj_in.parent_id:
-            parent = await LocationService.get(db, obj_in.parent_id)
-            if not parent:
+            if not await LocationService._exists(db, obj_in.parent_id):
                 raise BadRequestException(detail=f"親拠点ID {obj_in.parent_id} は存在しません")
         
-        # コードを大文字に正規化
-        normalized_code = obj_in.code.upper()
+        # コードはスキーマのバリデータで大文字に正規化済み
+        normalized_code = obj_in.code
         
         # 循環参照をチェック
         if obj_in.parent_id:
             await LocationService._check_circular_reference(db, obj_in.parent_id, None)
         
-        # モデルインスタンス作成
-        db_obj = Location(
+        # INSERT ... RETURNING で作成とサーバー生成値の取得を1往復で行う
+        stmt = insert(Location).values(
             name=obj_in.name,
             code=normalized_code,
             type=obj_in.type,
@@ -200,10 +317,11 @@ class LocationService:
             latitude=obj_in.latitude,
             longitude=obj_in.longitude,
             established_date=obj_in.established_date,
-        )
+        ).returning(Location)
         
-        db.add(db_obj)
         try:
+            result = await db.execute(stmt)
+            db_obj = result.scalar_one()
             await db.commit()
         except IntegrityError as e:
             await db.rollback()
@@ -212,14 +330,14 @@ class LocationService:
             else:
                 raise ConflictException(detail=str(e))
                 
-        await db.refresh(db_obj)
         return db_obj
     
     @staticmethod
     async def update(
         db: AsyncSession, 
         db_obj: Location,
-        obj_in: Union[LocationUpdate, Dict[str, Any]]
+        obj_in: Union[LocationUpdate, Dict[str, Any]],
+        include_relations: bool = False,
     ) -> Location:
         """
         拠点情報更新
@@ -228,6 +346,7 @@ class LocationService:
             db: データベースセッション
             db_obj: 更新対象の拠点
             obj_in: 更新データ
+            include_relations: 親拠点・子拠点・所属ユーザーも読み込む場合はTrue
             
         Returns:
             Location: 更新された拠点
@@ -242,16 +361,11 @@ class LocationService:
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
             
-        # コードの正規化（含まれている場合）
-        if "code" in update_data and update_data["code"]:
-            update_data["code"] = update_data["code"].upper()
-        
         # 親拠点の変更がある場合
         if "parent_id" in update_data and update_data["parent_id"] != db_obj.parent_id:
             # 親拠点の存在確認
             if update_data["parent_id"]:
-                parent = await LocationService.get(db, update_data["parent_id"])
-                if not parent:
+                if not await LocationService._exists(db, update_data["parent_id"]):
                     raise BadRequestException(detail=f"親拠点ID {update_data['parent_id']} は存在しません")
                 
                 # 循環参照をチェック
@@ -263,14 +377,17 @@ class LocationService:
             .where(Location.id == db_obj.id)
             .values(**update_data)
             .returning(Location)
+            .execution_options(synchronize_session="fetch", populate_existing=True)
         )
         
         try:
             result = await db.execute(stmt)
+            updated_location = result.scalar_one()
             await db.commit()
             
-            # 更新された拠点を関連エンティティと共に取得
-            updated_location = await LocationService.get(db, db_obj.id)
+            # RETURNING の行をそのまま使用し、関連エンティティは要求された場合のみ読み込む
+            if include_relations:
+                await db.refresh(updated_location, attribute_names=["parent", "children", "users"])
             return updated_location
         except IntegrityError as e:
             await db.rollback()
@@ -296,23 +413,20 @@ class LocationService:
             NotFoundException: 拠点が見つからない場合
             BadRequestException: 子拠点が存在する場合
         """
-        # 拠点の存在確認
-        location = await LocationService.get(db, location_id)
-        if not location:
-            raise NotFoundException(detail=f"拠点ID {location_id} は存在しません")
-        
-        # 子拠点の存在確認
-        if location.children and len(location.children) > 0:
+        # 子拠点の存在確認（子拠点の行は読み込まずに判定）
+        has_children = await db.execute(
+            select(1).where(Location.parent_id == location_id).limit(1)
+        )
+        if has_children.first() is not None:
             raise BadRequestException(detail="子拠点が存在するため削除できません。先に子拠点を削除または移動してください。")
         
-        # SQLAlchemy 2.0のDELETE構文
+        # SQLAlchemy 2.0のDELETE構文（事前の存在確認はせず、RETURNING の有無で判定）
         stmt = delete(Location).where(Location.id == location_id).returning(Location)
         result = await db.execute(stmt)
         
-        # 削除された拠点を取得
+        # 削除された拠点を取得（対象が存在しない場合は0行）
         deleted_location = result.scalar_one_or_none()
         if not deleted_location:
-            # 通常はここには到達しないはず
             raise NotFoundException(detail=f"拠点ID {location_id} は存在しません")
             
         await db.commit()
@@ -364,14 +478,92 @@ class LocationService:
         pages = (total + size - 1) // size  # 切り上げ
         
         # レスポンス構築
-        return LocationPage(
-            items=locations,
+        # DB由来の値は検証済みのため、ページ外枠はバリデーションを省略して構築する
+        return LocationPage.model_construct(
+            items=_LOCATION_LIST_ADAPTER.validate_python(locations, from_attributes=True),
             total=total,
             page=page,
             size=size,
             pages=pages,
         )
     
+    @staticmethod
+    async def get_page_keyset(
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        size: int = 20,
+        type: Optional[LocationType] = None,
+        parent_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        prefecture: Optional[str] = None,
+    ) -> LocationCursorPage:
+        """
+        カーソル（キーセット）ページネーション付き拠点一覧取得
+        
+        OFFSET を使わず (type, name, id) の位置から続きを取得するため、深いページでも一定のコストで取得できる
+        
+        Args:
+            db: データベースセッション
+            cursor: 前ページの next_cursor（先頭ページの場合はNoneまたは空文字）
+            size: ページサイズ
+            type: 拠点タイプによるフィルタリング
+            parent_id: 親拠点IDによるフィルタリング
+            is_active: アクティブステータスによるフィルタリング
+            search: 名前またはコードによる検索
+            prefecture: 都道府県によるフィルタリング
+            
+        Returns:
+            LocationCursorPage: 拠点リストと次ページのカーソル
+            
+        Raises:
+            BadRequestException: カーソルの形式が不正な場合
+        """
+        filters = LocationService._build_filters(
+            type=type,
+            parent_id=parent_id,
+            is_active=is_active,
+            search=search,
+            prefecture=prefecture,
+        )
+        if cursor:
+            filters.append(
+                tuple_(Location.type, Location.name, Location.id) > _decode_cursor(cursor)
+            )
+        
+        result = await db.execute(
+            select(Location)
+            .where(*filters)
+            .options(raiseload("*"))
+            .order_by(Location.type, Location.name, Location.id)
+            .limit(size)
+        )
+        locations = result.scalars().all()
+        
+        # ページが埋まった場合のみ次ページが存在し得る
+        next_cursor = _encode_cursor(locations[-1]) if len(locations) == size else None
+        
+        return LocationCursorPage.model_construct(
+            items=_LOCATION_LIST_ADAPTER.validate_python(locations, from_attributes=True),
+            size=size,
+            next_cursor=next_cursor,
+        )
+    
+    @staticmethod
+    async def _exists(db: AsyncSession, location_id: int) -> bool:
+        """
+        拠点の存在確認（リレーションシップを読み込まない軽量なチェック）
+        
+        Args:
+            db: データベースセッション
+            location_id: 拠点ID
+            
+        Returns:
+            bool: 拠点が存在する場合はTrue
+        """
+        result = await db.execute(select(1).where(Location.id == location_id).limit(1))
+        return result.first() is not None
+    
     @staticmethod
     async def _check_circular_reference(
         db: AsyncSession,
@@ -393,15 +585,23 @@ class LocationService:
         if parent_id == current_id:
             raise BadRequestException(detail="拠点は自分自身を親にできません")
         
-        # 親の親を再帰的にチェック
-        parent = await LocationService.get(db, parent_id)
-        if not parent:
+        # 新規作成時は自身が階層に存在しないため、循環は起こり得ない
+        if current_id is None:
             return
         
-        if parent.parent_id:
-            # 親の親が現在の拠点の場合、循環参照となる
-            if parent.parent_id == current_id:
-                raise BadRequestException(detail="循環参照は許可されていません")
-            
-            # 親の親を再帰的にチェック
-            await LocationService._check_circular_reference(db, parent.parent_id, current_id)
\ No newline at end of file
+        # 親拠点から祖先方向へ辿る再帰CTEで、現在の拠点が祖先に含まれるかを1クエリで判定
+        # （UNIONで重複を除くため、既存データに循環があっても探索は終了する）
+        ancestors = (
+            select(Location.id, Location.parent_id)
+            .where(Location.id == parent_id)
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union(
+            select(Location.id, Location.parent_id)
+            .join(ancestors, Location.id == ancestors.c.parent_id)
+        )
+        result = await db.execute(
+            select(ancestors.c.id).where(ancestors.c.id == current_id).limit(1)
+        )
+        if result.first() is not None:
+            raise BadRequestException(detail="循環参照は許可されていません")
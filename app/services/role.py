@@ -1,131 +1,177 @@
-from enum import Enum
-from typing import List, Dict
-from fastapi import Depends, HTTPException, status
-
-from app.api.dependencies.auth import get_current_active_user
-from app.core.exceptions import ForbiddenException
-from app.models.user import User
-
-class Permission(str, Enum):
-    # ユーザー管理関連
-    READ_USERS = "read:users"
-    WRITE_USERS = "write:users"
-    MANAGE_USERS = "manage:users"
-    
-    # ロール関連
-    READ_ROLES = "read:roles"
-    WRITE_ROLES = "write:roles"
-    
-    # 拠点関連
-    READ_LOCATIONS = "read:locations"
-    WRITE_LOCATIONS = "write:locations"
-    MANAGE_LOCATIONS = "manage:locations"
-    
-    # カタログ関連
-    READ_CATALOG = "read:catalog"
-    WRITE_CATALOG = "write:catalog"
-    MANAGE_CATALOG = "manage:catalog"
-    
-    # 在庫関連
-    READ_INVENTORY = "read:inventory"
-    WRITE_INVENTORY = "write:inventory"
-    MANAGE_INVENTORY = "manage:inventory"
-    
-    # スケジュール関連
-    READ_SCHEDULES = "read:schedules"
-    WRITE_SCHEDULES = "write:schedules"
-    MANAGE_SCHEDULES = "manage:schedules"
-    
-    # 顧客関連
-    READ_CLIENTS = "read:clients"
-    WRITE_CLIENTS = "write:clients"
-    MANAGE_CLIENTS = "manage:clients"
-    
-    # 自分のリソースに対する権限
-    READ_OWN = "read:own"
-    WRITE_OWN = "write:own"
-    
-    # 管理者権限
-    ADMIN = "admin"
-
-# システムロールと関連権限の定義
-SYSTEM_ROLES = {
-    "superuser": {
-        "name": "スーパーユーザー",
-        "description": "システム管理者。すべての権限を持つ。",
-        "permissions": [p.value for p in Permission]
-    },
-    "general_manager": {
-        "name": "統括マネージャー",
-        "description": "統括マネージャー。ほとんどの権限を持つが、システム設定は変更できない。",
-        "permissions": [
-            Permission.READ_USERS.value, Permission.WRITE_USERS.value,
-            Permission.READ_ROLES.value,
-            Permission.READ_LOCATIONS.value, Permission.WRITE_LOCATIONS.value, Permission.MANAGE_LOCATIONS.value,
-            Permission.READ_CATALOG.value, Permission.WRITE_CATALOG.value, Permission.MANAGE_CATALOG.value,
-            Permission.READ_INVENTORY.value, Permission.WRITE_INVENTORY.value, Permission.MANAGE_INVENTORY.value,
-            Permission.READ_SCHEDULES.value, Permission.WRITE_SCHEDULES.value, Permission.MANAGE_SCHEDULES.value,
-            Permission.READ_CLIENTS.value, Permission.WRITE_CLIENTS.value, Permission.MANAGE_CLIENTS.value,
-            Permission.READ_OWN.value, Permission.WRITE_OWN.value
-        ]
-    },
-    "area_manager": {
-        "name": "エリアマネージャー",
-        "description": "エリアマネージャー。担当エリアに対する管理権限を持つ。",
-        "permissions": [
-            Permission.READ_USERS.value,
-            Permission.READ_LOCATIONS.value, Permission.WRITE_LOCATIONS.value,
-            Permission.READ_CATALOG.value,
-            Permission.READ_INVENTORY.value, Permission.WRITE_INVENTORY.value,
-            Permission.READ_SCHEDULES.value, Permission.WRITE_SCHEDULES.value, Permission.MANAGE_SCHEDULES.value,
-            Permission.READ_CLIENTS.value, Permission.WRITE_CLIENTS.value,
-            Permission.READ_OWN.value, Permission.WRITE_OWN.value
-        ]
-    },
-    "staff": {
-        "name": "スタッフ",
-        "description": "一般スタッフ。基本的な操作権限を持つ。",
-        "permissions": [
-            Permission.READ_LOCATIONS.value,
-            Permission.READ_CATALOG.value,
-            Permission.READ_INVENTORY.value,
-            Permission.READ_SCHEDULES.value, Permission.WRITE_SCHEDULES.value,
-            Permission.READ_CLIENTS.value, Permission.WRITE_CLIENTS.value,
-            Permission.READ_OWN.value, Permission.WRITE_OWN.value
-        ]
-    }
-}
-
-def get_user_permissions(user: User) -> List[str]:
-    """ユーザーの権限リストを取得"""
-    # スーパーユーザーは全権限を持つ
-    if user.is_superuser:
-        return [p.value for p in Permission]
-    
-    # ロールがない場合は基本権限のみ
-    if not user.role or not user.role.permissions:
-        return [Permission.READ_OWN.value, Permission.WRITE_OWN.value]
-    
-    # JSON文字列から権限リストに変換
-    import json
-    try:
-        return json.loads(user.role.permissions)
-    except json.JSONDecodeError:
-        return [Permission.READ_OWN.value, Permission.WRITE_OWN.value]
-
-def has_permission(required_permission: Permission):
-    """権限チェック用の依存関係"""
-    def dependency(current_user: User = Depends(get_current_active_user)):
-        # ユーザーの権限を取得
-        user_permissions = get_user_permissions(current_user)
-        
-        # スーパーユーザーまたは管理者権限を持つ場合は許可
-        if current_user.is_superuser or Permission.ADMIN.value in user_permissions:
-            return current_user
-            
-        # 必要な権限を持っているか確認
-        if required_permission.value not in user_permissions:
-            raise ForbiddenException(detail=f"Required permission: {required_permission.value}")
-            
-        return current_user
-    return dependency
\ No newline at end of file
+"""
+app/services/role.py
+
+ユーザーロール関連のビジネスロジックを扱うサービス
+ロールのCRUD操作とシステムロールの初期化を実装
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.core.exceptions import BadRequestException, ConflictException, NotFoundException
+from app.core.permissions import SYSTEM_ROLES
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.schemas.role import RoleCreate, RoleUpdate
+from app.services import _role_cache
+
+
+class RoleService:
+    """
+    ロール関連のビジネスロジックを扱うサービスクラス
+    SQLAlchemy 2.0の非同期APIを活用
+    """
+
+    @staticmethod
+    async def get(db: AsyncSession, role_id: int) -> Optional[Role]:
+        """
+        IDによるロール取得
+        """
+        result = await db.execute(select(Role).where(Role.id == role_id))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_by_name(db: AsyncSession, name: str) -> Optional[Role]:
+        """
+        ロール名によるロール取得
+        """
+        result = await db.execute(select(Role).where(Role.name == name))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_multi(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        include_system_roles: bool = True,
+    ) -> List[Role]:
+        """
+        複数ロールの取得（ページネーション付き）
+        """
+        query = select(Role)
+        if not include_system_roles:
+            query = query.where(Role.is_system_role.is_(False))
+
+        result = await db.execute(query.order_by(Role.id).offset(skip).limit(limit))
+        return result.scalars().all()
+
+    @staticmethod
+    async def create(db: AsyncSession, obj_in: RoleCreate) -> Role:
+        """
+        ロール作成
+
+        Raises:
+            ConflictException: ロール名が既に存在する場合
+        """
+        db_obj = Role(
+            name=obj_in.name,
+            description=obj_in.description,
+            is_system_role=False,
+            permission_links=[
+                RolePermission(permission=permission)
+                for permission in dict.fromkeys(obj_in.permissions)
+            ],
+        )
+        db.add(db_obj)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ConflictException(detail=f"ロール名 '{obj_in.name}' は既に使用されています")
+
+        await db.refresh(db_obj)
+        return db_obj
+
+    @staticmethod
+    async def update(
+        db: AsyncSession,
+        db_obj: Role,
+        obj_in: Union[RoleUpdate, Dict[str, Any]]
+    ) -> Role:
+        """
+        ロール情報更新
+
+        Raises:
+            BadRequestException: システムロールを更新しようとした場合
+            ConflictException: ロール名が既に存在する場合
+        """
+        if db_obj.is_system_role:
+            raise BadRequestException(detail="システムロールは更新できません")
+
+        if isinstance(obj_in, dict):
+            update_data = obj_in.copy()
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        # 権限は関連テーブルで管理するため、差分のみを追加・削除する
+        permissions = update_data.pop("permissions", None)
+        if permissions is not None:
+            new_permissions = dict.fromkeys(permissions)
+            db_obj.permission_links = [
+                link for link in db_obj.permission_links if link.permission in new_permissions
+            ]
+            existing = {link.permission for link in db_obj.permission_links}
+            db_obj.permission_links.extend(
+                RolePermission(permission=permission)
+                for permission in new_permissions
+                if permission not in existing
+            )
+
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ConflictException(detail=f"ロール名 '{update_data.get('name')}' は既に使用されています")
+
+        _role_cache.invalidate(db_obj.id)
+        await db.refresh(db_obj)
+        return db_obj
+
+    @staticmethod
+    async def delete(db: AsyncSession, role_id: int) -> Role:
+        """
+        ロール削除
+
+        Raises:
+            NotFoundException: ロールが見つからない場合
+            BadRequestException: システムロールを削除しようとした場合
+        """
+        role = await RoleService.get(db, role_id)
+        if not role:
+            raise NotFoundException(detail=f"ロールID {role_id} は存在しません")
+        if role.is_system_role:
+            raise BadRequestException(detail="システムロールは削除できません")
+
+        await db.delete(role)
+        await db.commit()
+        _role_cache.invalidate(role_id)
+        return role
+
+    @staticmethod
+    async def initialize_system_roles(db: AsyncSession) -> None:
+        """
+        システムロールの初期化
+        定義済みのシステムロールが存在しない場合のみ作成する
+        """
+        result = await db.execute(select(Role.name))
+        existing_names = set(result.scalars().all())
+
+        for role_def in SYSTEM_ROLES.values():
+            if role_def["name"] in existing_names:
+                continue
+            db.add(Role(
+                name=role_def["name"],
+                description=role_def["description"],
+                is_system_role=True,
+                permission_links=[
+                    RolePermission(permission=permission)
+                    for permission in role_def["permissions"]
+                ],
+            ))
+
+        await db.commit()
@@ -7,15 +7,52 @@ app/services/user.py
 
 from typing import Any, Dict, Optional, Union, List
 import json
-from sqlalchemy import select, update, delete, func
+from functools import lru_cache
+from sqlalchemy import Select, select, insert, update, delete, func, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload, raiseload, noload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from app.core.exceptions import ConflictException, NotFoundException
-from app.core.security import get_password_hash, verify_password
+from app.core.security import password_needs_rehash
+from app.core.security_pool import hash_password_async, verify_password_async
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services import _role_cache, _user_cache
+
+# 頻繁に実行する検索クエリ（呼び出しごとの文の組み立てを避けるため初回のみ構築）
+# ※ リレーションシップのローダーオプションはマッパー構成を伴うため、モジュール読み込み時ではなく初回呼び出し時に構築する
+@lru_cache(maxsize=1)
+def _user_by_email_query() -> Select:
+    """メールアドレスによるユーザー検索クエリ（ロール情報も取得）"""
+    return (
+        select(User)
+        .options(selectinload(User.role))
+        .where(User.email == bindparam("email"))
+    )
+
+@lru_cache(maxsize=1)
+def _user_by_employee_id_query() -> Select:
+    """従業員IDによるユーザー検索クエリ（存在確認用途のため、リレーションシップへの想定外アクセスは即座にエラーとする）"""
+    return (
+        select(User)
+        .options(raiseload("*"))
+        .where(User.employee_id == bindparam("employee_id"))
+    )
+
+# 存在しないユーザーの認証でも同等の検証コストをかけるためのダミーハッシュ（初回のみ生成）
+_dummy_hash: Optional[str] = None
+
+async def _get_dummy_hash() -> str:
+    """
+    ダミーハッシュの取得
+    生成もCPU負荷が高いためスレッドプールで行い、ハッシュ設定の変更後（テストでのコスト変更等）は現在の設定で作り直す
+    """
+    global _dummy_hash
+    if _dummy_hash is None or password_needs_rehash(_dummy_hash):
+        _dummy_hash = await hash_password_async("not-a-password")
+    return _dummy_hash
 
 class UserService:
     """
@@ -28,10 +65,11 @@ class UserService:
         """
         IDによるユーザー取得（ロール情報も取得）
         """
-        # SQLAlchemy 2.0のSELECT構文
+        # 識別マップからの返却（session.get）は削除済みの行を返しうるため、毎回SQLで存在を確認する
+        # （ロールは同じクエリ内で JOIN して取得）
         result = await db.execute(
             select(User)
-            .options(selectinload(User.role))  # ロール情報も取得
+            .options(joinedload(User.role))
             .where(User.id == user_id)
         )
         return result.scalar_one_or_none()
@@ -40,20 +78,32 @@ class UserService:
     async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """
         メールアドレスによるユーザー取得（ロール情報も取得）
+        ログイン等で繰り返し呼ばれるため、メールアドレスからユーザーIDへの対応を短い有効期限でキャッシュし、
+        ユーザー本体は呼び出し元のセッションで主キー取得する
         """
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.role))
-            .where(User.email == email)
-        )
-        return result.scalar_one_or_none()
+        # メールアドレスは小文字で保存しているため、検索キーも同様に正規化
+        email = email.strip().lower()
+        user_id = _user_cache.get(email)
+        if user_id is not None:
+            # 主キー取得のため、セッションの識別マップにあればSQLを発行しない
+            # （ロールはリレーションシップ既定の JOINED ローディングで同じクエリ内に取得）
+            user = await db.get(User, user_id)
+            if user is not None and user.email == email:
+                return user
+            # 他ワーカーでの削除・メールアドレス変更等によりキャッシュが古い場合は破棄して検索し直す
+            _user_cache.invalidate(email)
+        result = await db.execute(_user_by_email_query(), {"email": email})
+        user = result.scalar_one_or_none()
+        if user is not None:
+            _user_cache.store(user.email, user.id)
+        return user
     
     @staticmethod
     async def get_by_employee_id(db: AsyncSession, employee_id: str) -> Optional[User]:
         """
         従業員IDによるユーザー取得
         """
-        result = await db.execute(select(User).where(User.employee_id == employee_id))
+        result = await db.execute(_user_by_employee_id_query(), {"employee_id": employee_id})
         return result.scalar_one_or_none()
     
     @staticmethod
@@ -69,7 +119,9 @@ class UserService:
         複数ユーザーの取得（ページネーション付き）
         フィルタとして役割ID、アクティブステータス、検索キーワードを指定可能
         """
-        query = select(User).options(selectinload(User.role))
+        # ロールはクエリ後にキャッシュ経由で解決するため読み込まず、
+        # それ以外のリレーションシップへの想定外アクセス（N+1）は即座にエラーとする
+        query = select(User).options(noload(User.role), raiseload("*"))
         
         # フィルタが指定されている場合は適用
         if role_id is not None:
@@ -79,28 +131,32 @@ class UserService:
             query = query.where(User.is_active == is_active)
             
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                (User.email.ilike(search_term)) |
-                (User.full_name.ilike(search_term)) |
-                (User.first_name.ilike(search_term)) |
-                (User.last_name.ilike(search_term)) |
-                (User.employee_id.ilike(search_term))
-            )
+            # 検索対象カラムを連結した1つの式に対する部分一致（関数トライグラムインデックスを使用）
+            query = query.where(User.search_text().like(f"%{search.lower()}%"))
             
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
-        return result.scalars().all()
+        users = result.scalars().all()
+        
+        # ページ内のロールをキャッシュ経由でまとめて取得し、各ユーザーに紐付ける
+        roles = await _role_cache.get_roles(
+            db, {user.role_id for user in users if user.role_id is not None}
+        )
+        for user in users:
+            set_committed_value(user, "role", roles.get(user.role_id))
+        return users
     
     @staticmethod
     async def create(db: AsyncSession, obj_in: UserCreate) -> User:
         """
         ユーザー作成（拡張）
         """
-        # パスワードをハッシュ化
-        db_obj = User(
+        # パスワードをハッシュ化（イベントループを塞がないようスレッドプールで実行）
+        hashed_password = await hash_password_async(obj_in.password)
+        # INSERT ... RETURNING で作成とサーバー生成値の取得を1往復で行う
+        stmt = insert(User).values(
             email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password,
             first_name=obj_in.first_name,
             last_name=obj_in.last_name,
             full_name=obj_in.full_name or f"{obj_in.first_name or ''} {obj_in.last_name or ''}".strip(),
@@ -114,11 +170,13 @@ class UserService:
             address=obj_in.address,
             date_of_birth=obj_in.date_of_birth,
             hire_date=obj_in.hire_date
-        )
+        ).returning(User)
         
-        db.add(db_obj)
         try:
+            result = await db.execute(stmt)
+            db_obj = result.scalar_one()
             await db.commit()
+            _user_cache.invalidate(db_obj.email)
         except IntegrityError as e:
             await db.rollback()
             # 一意性制約違反のエラーメッセージを特定
@@ -129,14 +187,14 @@ class UserService:
             else:
                 raise ConflictException(detail=str(e))
             
-        await db.refresh(db_obj)
         return db_obj
     
     @staticmethod
     async def update(
         db: AsyncSession, 
         db_obj: User,
-        obj_in: Union[UserUpdate, Dict[str, Any]]
+        obj_in: Union[UserUpdate, Dict[str, Any]],
+        include_relations: bool = False,
     ) -> User:
         """
         ユーザー情報更新（拡張）
@@ -149,7 +207,7 @@ class UserService:
             
         # パスワードが含まれる場合はハッシュ化して更新
         if "password" in update_data and update_data["password"]:
-            hashed_password = get_password_hash(update_data.pop("password"))
+            hashed_password = await hash_password_async(update_data.pop("password"))
             update_data["hashed_password"] = hashed_password
             
         # フルネームの自動生成（first_nameまたはlast_nameが更新された場合）
@@ -168,14 +226,21 @@ class UserService:
             .where(User.id == db_obj.id)
             .values(**update_data)
             .returning(User)
+            .execution_options(synchronize_session="fetch", populate_existing=True)
         )
         
+        previous_email = db_obj.email
         try:
             result = await db.execute(stmt)
+            updated_user = result.scalar_one()
             await db.commit()
+            # 変更前後のメールアドレスのキャッシュを破棄
+            _user_cache.invalidate(previous_email)
+            _user_cache.invalidate(updated_user.email)
             
-            # 更新されたユーザーを関連エンティティと共に取得
-            updated_user = await UserService.get(db, db_obj.id)
+            # RETURNING の行をそのまま使用し、関連エンティティは要求された場合のみ読み込む
+            if include_relations:
+                await db.refresh(updated_user, attribute_names=["role"])
             return updated_user
         except IntegrityError as e:
             await db.rollback()
@@ -192,22 +257,18 @@ class UserService:
         """
         ユーザー削除
         """
-        # 存在確認
-        user = await UserService.get(db, user_id)
-        if not user:
-            raise NotFoundException(detail=f"User with ID {user_id} not found")
-            
-        # SQLAlchemy 2.0のDELETE構文
+        # SQLAlchemy 2.0のDELETE構文（事前の存在確認はせず、RETURNING の有無で判定）
         stmt = delete(User).where(User.id == user_id).returning(User)
         result = await db.execute(stmt)
         
-        # 削除されたユーザーを取得
-        deleted_user = result.scalar_one_or_none()
-        if not deleted_user:
-            # 通常はここには到達しないはず
+        # 削除されたユーザーを取得（対象が存在しない場合は0行）
+        try:
+            deleted_user = result.scalar_one()
+        except NoResultFound:
             raise NotFoundException(detail=f"User with ID {user_id} not found")
             
         await db.commit()
+        _user_cache.invalidate(deleted_user.email)
         return deleted_user
     
     @staticmethod
@@ -216,10 +277,17 @@ class UserService:
         メールアドレスとパスワードによるユーザー認証
         """
         user = await UserService.get_by_email(db, email)
-        if not user:
-            return None
-        if not verify_password(password, user.hashed_password):
+        
+        # ユーザーの有無に関わらず同じコストの検証を1回行い、応答時間からの存在推測を防ぐ
+        # （ハッシュ検証はCPU負荷が高いため、イベントループを塞がないようスレッドプールで実行）
+        hashed_password = user.hashed_password if user else await _get_dummy_hash()
+        verified = await verify_password_async(password, hashed_password)
+        if user is None or not verified:
             return None
+        
+        # 旧方式（bcrypt等）のハッシュは、平文が手元にある認証成功時にArgon2idへ移行
+        if password_needs_rehash(user.hashed_password):
+            user = await UserService.update(db, user, {"password": password})
         return user
     
     @staticmethod
@@ -246,4 +314,5 @@ class UserService:
         if not updated_user:
             raise NotFoundException(detail=f"User with ID {user_id} not found")
             
+        _user_cache.invalidate(updated_user.email)
         return updated_user
\ No newline at end of file
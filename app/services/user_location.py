@@ -5,18 +5,45 @@ app/services/user_location.py
 ユーザーの拠点所属情報のCRUD操作を実装
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, Tuple
-from sqlalchemy import select, update, delete, func, and_, or_
+from pydantic import TypeAdapter
+from sqlalchemy import Select, select, insert, update, delete, func, and_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
-from sqlalchemy.exc import IntegrityError
-from datetime import date
+from sqlalchemy.orm import joinedload, selectinload, contains_eager
+from sqlalchemy.exc import IntegrityError, NoResultFound
+from datetime import timedelta
 
 from app.core.exceptions import ConflictException, NotFoundException, BadRequestException
 from app.models.user_location import UserLocation
 from app.models.user import User
 from app.models.location import Location
-from app.schemas.user_location import UserLocationCreate, UserLocationUpdate, UserLocationPage
+from app.schemas.user_location import (
+    UserLocationCreate, UserLocationUpdate, UserLocationPage, UserLocationWithUser
+)
+
+# ページ内ユーザー所属情報の変換用アダプタ（モジュール読み込み時に一度だけ構築）
+_USER_LOCATION_LIST_ADAPTER = TypeAdapter(List[UserLocationWithUser])
+
+@lru_cache(maxsize=1)
+def _by_user_location_query() -> Select:
+    """
+    ユーザーと拠点の組み合わせによる所属情報の検索クエリ（呼び出しごとの文の組み立てを避けるため初回のみ構築）
+    ※ リレーションシップのローダーオプションはマッパー構成を伴うため、モジュール読み込み時には構築しない
+    """
+    return (
+        select(UserLocation)
+        .options(
+            joinedload(UserLocation.user),
+            joinedload(UserLocation.location)
+        )
+        .where(
+            and_(
+                UserLocation.user_id == bindparam("user_id"),
+                UserLocation.location_id == bindparam("location_id")
+            )
+        )
+    )
 
 class UserLocationService:
     """
@@ -65,31 +92,13 @@ class UserLocationService:
         Returns:
             List[UserLocation]: ユーザー所属情報リスト
         """
-        query = (
-            select(UserLocation)
-            .options(
-                joinedload(UserLocation.user),
-                joinedload(UserLocation.location)
-            )
-            .where(
-                and_(
-                    UserLocation.user_id == user_id,
-                    UserLocation.location_id == location_id
-                )
-            )
-        )
+        query = _by_user_location_query()
         
         # アクティブな割り当てのみ（終了日が設定されていないか今日以降）
         if not include_inactive:
-            today = date.today()
-            query = query.where(
-                or_(
-                    UserLocation.end_date == None,
-                    UserLocation.end_date >= today
-                )
-            )
+            query = query.where(UserLocation.active_filter())
         
-        result = await db.execute(query)
+        result = await db.execute(query, {"user_id": user_id, "location_id": location_id})
         return result.scalars().all()
     
     @staticmethod
@@ -109,23 +118,18 @@ class UserLocationService:
         Returns:
             List[UserLocation]: ユーザー所属情報リスト
         """
+        # 拠点は別の IN クエリでまとめて取得し、拠点側の子拠点・所属ユーザー等の連鎖読み込みは抑止
         query = (
             select(UserLocation)
             .options(
-                joinedload(UserLocation.location)
+                selectinload(UserLocation.location).raiseload("*")
             )
             .where(UserLocation.user_id == user_id)
         )
         
         # アクティブな割り当てのみ（終了日が設定されていないか今日以降）
         if not include_inactive:
-            today = date.today()
-            query = query.where(
-                or_(
-                    UserLocation.end_date == None,
-                    UserLocation.end_date >= today
-                )
-            )
+            query = query.where(UserLocation.active_filter())
             
         # 主所属を優先して並べ替え
         query = query.order_by(
@@ -170,40 +174,25 @@ class UserLocationService:
         
         # フィルタリング条件を適用
         if not include_inactive:
-            today = date.today()
-            query = query.where(
-                or_(
-                    UserLocation.end_date == None,
-                    UserLocation.end_date >= today
-                )
-            )
+            query = query.where(UserLocation.active_filter())
         
         if is_primary is not None:
             query = query.where(UserLocation.is_primary == is_primary)
             
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                or_(
-                    User.email.ilike(search_term),
-                    User.full_name.ilike(search_term),
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
-                    User.employee_id.ilike(search_term)
-                )
-            )
+            # 検索対象カラムを連結した1つの式に対する部分一致（関数トライグラムインデックスを使用）
+            query = query.where(User.search_text().like(f"%{search.lower()}%"))
             
-        # 総数取得
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await db.execute(count_query)
-        total_count = total.scalar_one()
-        
         # ページネーション適用とリレーションシップのロード
+        # ユーザーは検索・並べ替えのため既に JOIN しているのでその結合結果から読み込み（二重JOINを避ける）、
+        # 拠点はページ内の ID で別の IN クエリにまとめて取得し、ページクエリの行幅を抑える
+        # 総数はウィンドウ関数でページの各行に付与し、件数取得のための別クエリを省略
         items_query = (
             query
+            .add_columns(func.count().over().label("total_count"))
             .options(
-                joinedload(UserLocation.user),
-                joinedload(UserLocation.location)
+                contains_eager(UserLocation.user),
+                selectinload(UserLocation.location).raiseload("*")
             )
             .order_by(
                 UserLocation.is_primary.desc(),
@@ -214,7 +203,17 @@ class UserLocationService:
         )
         
         result = await db.execute(items_query)
-        user_locations = result.scalars().all()
+        rows = result.all()
+        user_locations = [row.UserLocation for row in rows]
+        
+        if rows:
+            total_count = rows[0].total_count
+        elif skip == 0:
+            total_count = 0
+        else:
+            # 範囲外のページでは行が返らず総数も得られないため、その場合のみ件数を別途取得
+            count_query = select(func.count()).select_from(query.subquery())
+            total_count = (await db.execute(count_query)).scalar_one()
         
         return user_locations, total_count
     
@@ -232,47 +231,35 @@ class UserLocationService:
             
         Raises:
             BadRequestException: ユーザーまたは拠点が存在しない場合
-            ConflictException: 同じユーザーと拠点の組み合わせで主所属の割り当てが既に存在する場合
+            ConflictException: ユーザーに有効な主所属の割り当てが既に存在する場合
         """
-        # ユーザーの存在確認
-        user_result = await db.execute(select(User).where(User.id == obj_in.user_id))
-        user = user_result.scalar_one_or_none()
-        if not user:
+        # ユーザーと拠点の存在確認（EXISTS をまとめた1回のクエリで判定）
+        exists_result = await db.execute(
+            select(
+                select(User.id).where(User.id == obj_in.user_id).exists().label("user_exists"),
+                select(Location.id).where(Location.id == obj_in.location_id).exists().label("location_exists"),
+            )
+        )
+        user_exists, location_exists = exists_result.one()
+        if not user_exists:
             raise BadRequestException(detail=f"ユーザーID {obj_in.user_id} は存在しません")
-            
-        # 拠点の存在確認
-        location_result = await db.execute(select(Location).where(Location.id == obj_in.location_id))
-        location = location_result.scalar_one_or_none()
-        if not location:
+        if not location_exists:
             raise BadRequestException(detail=f"拠点ID {obj_in.location_id} は存在しません")
         
-        # 主所属の場合、既存の主所属をチェック
+        # 主所属の場合、既存の主所属の終了日を新しい開始日の前日に設定（1回のUPDATEで一括更新）
         if obj_in.is_primary:
-            existing_primaries = await db.execute(
-                select(UserLocation)
+            await db.execute(
+                update(UserLocation)
                 .where(
-                    and_(
-                        UserLocation.user_id == obj_in.user_id,
-                        UserLocation.is_primary == True,
-                        or_(
-                            UserLocation.end_date == None,
-                            UserLocation.end_date >= obj_in.start_date
-                        )
-                    )
+                    UserLocation.user_id == obj_in.user_id,
+                    UserLocation.is_primary == True,
+                    UserLocation.active_filter(obj_in.start_date)
                 )
+                .values(end_date=obj_in.start_date - timedelta(days=1))
             )
-            
-            primaries = existing_primaries.scalars().all()
-            if primaries:
-                # 既存の主所属がある場合は、その終了日を新しい開始日の前日に設定
-                for primary in primaries:
-                    primary.end_date = obj_in.start_date.replace(
-                        day=obj_in.start_date.day - 1
-                    )
-                    db.add(primary)
         
-        # モデルインスタンス作成
-        db_obj = UserLocation(
+        # INSERT ... RETURNING で作成とサーバー生成値の取得を1往復で行う
+        stmt = insert(UserLocation).values(
             user_id=obj_in.user_id,
             location_id=obj_in.location_id,
             is_primary=obj_in.is_primary,
@@ -281,26 +268,58 @@ class UserLocationService:
             start_date=obj_in.start_date,
             end_date=obj_in.end_date,
             notes=obj_in.notes
-        )
+        ).returning(UserLocation)
         
-        db.add(db_obj)
         try:
+            result = await db.execute(stmt)
+            db_obj = result.scalar_one()
             await db.commit()
         except IntegrityError as e:
             await db.rollback()
             if "uq_user_location_primary" in str(e).lower():
-                raise ConflictException(detail="同じユーザーと拠点の組み合わせで主所属の割り当てが既に存在します")
+                raise ConflictException(detail="このユーザーには有効な主所属の割り当てが既に存在します")
             else:
                 raise ConflictException(detail=str(e))
-                
-        await db.refresh(db_obj)
+
         return db_obj
+
+    @staticmethod
+    async def bulk_create(db: AsyncSession, objs_in: List[UserLocationCreate]) -> int:
+        """
+        ユーザー所属情報の一括作成（初期データ投入・データ移行用）
+
+        ※ 1件ずつの create と異なり、ユーザー・拠点の存在確認や既存の主所属の終了日設定は行わない
+
+        Args:
+            db: データベースセッション
+            objs_in: 作成するユーザー所属情報のリスト
+
+        Returns:
+            int: 作成した件数
+
+        Raises:
+            ConflictException: 一意制約・外部キー制約に違反する割り当てが含まれる場合
+        """
+        if not objs_in:
+            return 0
+
+        # パラメータのリストを渡すことで、1行ずつのINSERTではなくドライバの executemany で一括送信する
+        rows = [obj_in.model_dump() for obj_in in objs_in]
+        try:
+            await db.execute(insert(UserLocation), rows)
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise ConflictException(detail=str(e))
+
+        return len(rows)
     
     @staticmethod
     async def update(
         db: AsyncSession, 
         db_obj: UserLocation,
-        obj_in: Union[UserLocationUpdate, Dict[str, Any]]
+        obj_in: Union[UserLocationUpdate, Dict[str, Any]],
+        include_relations: bool = False,
     ) -> UserLocation:
         """
         ユーザー所属情報更新
@@ -309,12 +328,13 @@ class UserLocationService:
             db: データベースセッション
             db_obj: 更新対象のユーザー所属情報
             obj_in: 更新データ
+            include_relations: ユーザー・拠点も読み込む場合はTrue
             
         Returns:
             UserLocation: 更新されたユーザー所属情報
             
         Raises:
-            ConflictException: 同じユーザーと拠点の組み合わせで主所属の割り当てが既に存在する場合
+            ConflictException: ユーザーに有効な主所属の割り当てが既に存在する場合
         """
         # 更新データを準備
         if isinstance(obj_in, dict):
@@ -324,32 +344,18 @@ class UserLocationService:
             
         # 主所属の変更がある場合
         if "is_primary" in update_data and update_data["is_primary"] and not db_obj.is_primary:
-            # 既存の主所属をチェック
-            existing_primaries = await db.execute(
-                select(UserLocation)
+            # 既存の主所属の終了日を新しい開始日の前日に設定（1回のUPDATEで一括更新）
+            start_date = update_data.get("start_date", db_obj.start_date)
+            await db.execute(
+                update(UserLocation)
                 .where(
-                    and_(
-                        UserLocation.user_id == db_obj.user_id,
-                        UserLocation.id != db_obj.id,
-                        UserLocation.is_primary == True,
-                        or_(
-                            UserLocation.end_date == None,
-                            UserLocation.end_date >= (
-                                update_data.get("start_date", db_obj.start_date)
-                            )
-                        )
-                    )
+                    UserLocation.user_id == db_obj.user_id,
+                    UserLocation.id != db_obj.id,
+                    UserLocation.is_primary == True,
+                    UserLocation.active_filter(start_date)
                 )
+                .values(end_date=start_date - timedelta(days=1))
             )
-            
-            primaries = existing_primaries.scalars().all()
-            if primaries:
-                # 既存の主所属がある場合は、その終了日を新しい開始日の前日に設定
-                for primary in primaries:
-                    primary.end_date = update_data.get("start_date", db_obj.start_date).replace(
-                        day=update_data.get("start_date", db_obj.start_date).day - 1
-                    )
-                    db.add(primary)
         
         # SQLAlchemy 2.0のUPDATE構文
         stmt = (
@@ -357,19 +363,22 @@ class UserLocationService:
             .where(UserLocation.id == db_obj.id)
             .values(**update_data)
             .returning(UserLocation)
+            .execution_options(synchronize_session="fetch", populate_existing=True)
         )
         
         try:
             result = await db.execute(stmt)
+            updated_user_location = result.scalar_one()
             await db.commit()
             
-            # 更新されたユーザー所属情報を関連エンティティと共に取得
-            updated_user_location = await UserLocationService.get(db, db_obj.id)
+            # RETURNING の行をそのまま使用し、関連エンティティは要求された場合のみ読み込む
+            if include_relations:
+                await db.refresh(updated_user_location, attribute_names=["user", "location"])
             return updated_user_location
         except IntegrityError as e:
             await db.rollback()
             if "uq_user_location_primary" in str(e).lower():
-                raise ConflictException(detail="同じユーザーと拠点の組み合わせで主所属の割り当てが既に存在します")
+                raise ConflictException(detail="このユーザーには有効な主所属の割り当てが既に存在します")
             else:
                 raise ConflictException(detail=str(e))
     
@@ -388,19 +397,14 @@ class UserLocationService:
         Raises:
             NotFoundException: ユーザー所属情報が見つからない場合
         """
-        # ユーザー所属情報の存在確認
-        user_location = await UserLocationService.get(db, user_location_id)
-        if not user_location:
-            raise NotFoundException(detail=f"ユーザー所属情報ID {user_location_id} は存在しません")
-        
-        # SQLAlchemy 2.0のDELETE構文
+        # SQLAlchemy 2.0のDELETE構文（事前の存在確認はせず、RETURNING の有無で判定）
         stmt = delete(UserLocation).where(UserLocation.id == user_location_id).returning(UserLocation)
         result = await db.execute(stmt)
         
-        # 削除されたユーザー所属情報を取得
-        deleted_user_location = result.scalar_one_or_none()
-        if not deleted_user_location:
-            # 通常はここには到達しないはず
+        # 削除されたユーザー所属情報を取得（対象が存在しない場合は0行）
+        try:
+            deleted_user_location = result.scalar_one()
+        except NoResultFound:
             raise NotFoundException(detail=f"ユーザー所属情報ID {user_location_id} は存在しません")
             
         await db.commit()
@@ -449,8 +453,9 @@ class UserLocationService:
         pages = (total + size - 1) // size  # 切り上げ
         
         # レスポンス構築
-        return UserLocationPage(
-            items=user_locations,
+        # DB由来の値は検証済みのため、ページ外枠はバリデーションを省略して構築する
+        return UserLocationPage.model_construct(
+            items=_USER_LOCATION_LIST_ADAPTER.validate_python(user_locations, from_attributes=True),
             total=total,
             page=page,
             size=size,
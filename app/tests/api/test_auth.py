@@ -2,13 +2,18 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
 from app.core.security import decode_token
 from app.core.config import settings
 from app.services.user import UserService
-from app.schemas.user import UserCreate, TokenPayload
+from app.schemas.user import UserCreate
+from app.models.user import User
+
+# エンドポイントURL（テストごとの組み立てを避けるためモジュール読み込み時に一度だけ構築）
+AUTH_URL = f"{settings.API_V1_PREFIX}/auth"
 
 class TestAuthAPI:
     """認証API関連のテストクラス"""
@@ -24,7 +29,7 @@ class TestAuthAPI:
             "first_name": "Test User",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user_data,
         )
         assert response.status_code == 201
@@ -38,9 +43,9 @@ class TestAuthAPI:
         assert "password" not in result
         assert "hashed_password" not in result
 
-        user = await UserService.get_by_email(db_session, user_data["email"])
-        assert user is not None
-        assert user.email == user_data["email"]
+        # DB に登録されたことを確認（ロール等の関連は不要なため、メールアドレス列のみを取得）
+        db_email = await db_session.scalar(select(User.email).where(User.id == result["id"]))
+        assert db_email == user_data["email"]
 
     @pytest.mark.asyncio
     async def test_register_existing_user(self, async_client: AsyncClient, db_session: AsyncSession, setup_database):
@@ -54,12 +59,12 @@ class TestAuthAPI:
         }
         # 1回目の登録
         await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user_data,
         )
         # 2回目の登録
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user_data,
         )
         # Pydantic のバリデーションエラーの場合、422 Unprocessable Entity になる場合もある
@@ -67,27 +72,15 @@ class TestAuthAPI:
         assert "detail" in response.json()
 
     @pytest.mark.asyncio
-    async def test_login_user(self, async_client: AsyncClient, db_session: AsyncSession, setup_database):
+    async def test_login_user(self, async_client: AsyncClient, normal_user: User):
         """ユーザーログインAPIテスト"""
-        email = "login_test@example.com"
-        password = "loginpassword"
-        user_data = {
-            "email": email,
-            "username": "login_test",  # 登録時は username もセット
-            "password": password,
-            "last_name": "Login",
-            "first_name": "Test User",
-        }
-        await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
-            json=user_data,
-        )
+        # 登録APIは test_register_user で検証済みのため、ユーザーはフィクスチャで直接作成したものを使用
         login_data = {
-            "username": email,  # OAuth2PasswordRequestForm では username にメールアドレスを指定
-            "password": password,
+            "username": normal_user.email,  # OAuth2PasswordRequestForm では username にメールアドレスを指定
+            "password": "password123",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/login",
+            f"{AUTH_URL}/login",
             data=login_data,
         )
         assert response.status_code == 200
@@ -108,56 +101,39 @@ class TestAuthAPI:
             "password": "wrongpassword",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/login",
+            f"{AUTH_URL}/login",
             data=login_data,
         )
         assert response.status_code == 401
         assert "detail" in response.json()
 
     @pytest.mark.asyncio
-    async def test_refresh_token(self, async_client: AsyncClient, db_session: AsyncSession, setup_database):
+    async def test_refresh_token(self, async_client: AsyncClient, normal_user: User, normal_user_refresh_token: str):
         """トークンリフレッシュAPIテスト"""
-        email = "refresh_test@example.com"
-        password = "refreshpassword"
-        user_data = {
-            "email": email,
-            "username": "refresh_test",
-            "password": password,
-            "last_name": "Refresh",
-            "first_name": "Test User",
-        }
-        await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
-            json=user_data,
-        )
-        login_data = {
-            "username": email,
-            "password": password,
-        }
-        login_response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/login",
-            data=login_data,
-        )
-        login_json = login_response.json()
-        assert "refresh_token" in login_json, "Login response must contain refresh_token"
-        refresh_token = login_json["refresh_token"]
+        # ログインAPIは test_login_user で検証済みのため、リフレッシュトークンはフィクスチャで直接発行したものを使用
         refresh_response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/refresh",
-            json={"refresh_token": refresh_token},
+            f"{AUTH_URL}/refresh",
+            json={"refresh_token": normal_user_refresh_token},
         )
         assert refresh_response.status_code == 200
         result = refresh_response.json()
         assert "access_token" in result
         assert "refresh_token" in result
         assert result["token_type"] == "bearer"
-        # 新たに生成されたトークンは（iatの差分により）異なるはず
-        assert result["access_token"] != login_json["access_token"]
+        # 新たに発行されたトークンが対象ユーザーの正しい種別のトークンであること
+        token_payload = decode_token(result["access_token"])
+        assert token_payload["type"] == "access"
+        assert token_payload["sub"] == str(normal_user.id)
+        refresh_payload = decode_token(result["refresh_token"])
+        assert refresh_payload["type"] == "refresh"
+        assert refresh_payload["sub"] == str(normal_user.id)
 
     @pytest.mark.asyncio
-    async def test_refresh_token_with_invalid_token(self, async_client: AsyncClient, setup_database):
+    async def test_refresh_token_with_invalid_token(self, async_client: AsyncClient):
         """無効なリフレッシュトークンによるリフレッシュテスト"""
+        # トークンの検証で失敗しDBには到達しないため、DBのセットアップ（setup_database）は不要
         refresh_response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/refresh",
+            f"{AUTH_URL}/refresh",
             json={"refresh_token": "invalid_token"},
         )
         assert refresh_response.status_code == 401
@@ -167,12 +143,12 @@ class TestAuthAPI:
     async def test_password_reset_request(self, async_client: AsyncClient, normal_user, setup_database):
         """パスワードリセットリクエストテスト"""
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/password-reset-request",
+            f"{AUTH_URL}/password-reset-request",
             json={"email": normal_user.email},
         )
         assert response.status_code == 204
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/password-reset-request",
+            f"{AUTH_URL}/password-reset-request",
             json={"email": "nonexistent@example.com"},
         )
         assert response.status_code == 204
@@ -190,7 +166,7 @@ class TestAuthAPI:
             "phone_number": "090-7777-8888",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user_data,
         )
         assert response.status_code == 201
@@ -215,7 +191,7 @@ class TestAuthAPI:
             "password": "password123",
         }
         await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user1_data,
         )
         user2_data = {
@@ -224,7 +200,7 @@ class TestAuthAPI:
             "password": "password456",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/auth/register",
+            f"{AUTH_URL}/register",
             json=user2_data,
         )
         assert response.status_code in (409, 422)
@@ -1,14 +1,20 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict
 
 from app.core.config import settings
 from app.services.item import ItemService
+from app.models.item import Item
 from app.models.user import User
 from app.schemas.item import ItemCreate  # Pydantic v2 のモデル
 
 
+# エンドポイントURL（テストごとの組み立てを避けるためモジュール読み込み時に一度だけ構築）
+ITEMS_URL = f"{settings.API_V1_PREFIX}/items"
+
+
 class TestItemsAPI:
     """アイテムAPI関連のテストクラス"""
 
@@ -20,7 +26,7 @@ class TestItemsAPI:
             "description": "This is a test item created via API",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/items/",
+            f"{ITEMS_URL}/",
             headers=normal_user_token_headers,
             json=item_data,
         )
@@ -32,10 +38,9 @@ class TestItemsAPI:
         assert "owner_id" in created_item
         assert "created_at" in created_item
 
-        # DB に登録されたことを確認
-        db_item = await ItemService.get(db_session, created_item["id"])
-        assert db_item is not None
-        assert db_item.title == item_data["title"]
+        # DB に登録されたことを確認（ORMインスタンスは組み立てず、タイトル列のみを取得）
+        db_title = await db_session.scalar(select(Item.title).where(Item.id == created_item["id"]))
+        assert db_title == item_data["title"]
 
     @pytest.mark.asyncio
     async def test_create_item_without_auth(self, async_client: AsyncClient):
@@ -45,7 +50,7 @@ class TestItemsAPI:
             "description": "This should not be created",
         }
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/items/",
+            f"{ITEMS_URL}/",
             json=item_data,
         )
         assert response.status_code == 401
@@ -54,45 +59,35 @@ class TestItemsAPI:
     @pytest.mark.asyncio
     async def test_read_items_normal_user(self, async_client: AsyncClient, normal_user_token_headers: Dict[str, str], normal_user: User, db_session: AsyncSession, setup_database):
         """一般ユーザーのアイテム一覧取得テスト"""
-        # 3件のアイテムを作成
-        for i in range(3):
-            item_data = {"title": f"User Item {i}", "description": f"Description {i}"}
-            await ItemService.create(
-                db_session,
-                obj_in=ItemCreate(**item_data),
-                owner_id=normal_user.id,
-            )
+        # 3件のアイテムを一括作成
+        await ItemService.bulk_create(
+            db_session,
+            [ItemCreate(title=f"User Item {i}", description=f"Description {i}") for i in range(3)],
+            owner_id=normal_user.id,
+        )
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/items/",
+            f"{ITEMS_URL}/",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
         items_page = response.json()
-        assert "items" in items_page
-        assert "total" in items_page
-        assert "page" in items_page
-        assert "size" in items_page
-        assert "pages" in items_page
+        assert {"items", "total", "page", "size", "pages"} <= items_page.keys()
 
-        # 一般ユーザーは自分のアイテムのみ取得できる
+        # 一般ユーザーは自分のアイテムのみ取得できる（所有者IDの集合で一度に検証）
         assert items_page["total"] >= 3
-        for item in items_page["items"]:
-            assert item["owner_id"] == normal_user.id
+        assert {item["owner_id"] for item in items_page["items"]} == {normal_user.id}
 
     @pytest.mark.asyncio
     async def test_read_items_superuser(self, async_client: AsyncClient, superuser_token_headers: Dict[str, str], superuser: User, db_session: AsyncSession, setup_database):
         """管理者のアイテム一覧取得テスト（作成した全件が見えるはず）"""
-        # 管理者用のアイテムを2件作成
-        for i in range(2):
-            item_data = {"title": f"Admin Item {i}", "description": f"Admin Description {i}"}
-            # ここでは明示的に superuser.id を利用
-            await ItemService.create(
-                db_session,
-                obj_in=ItemCreate(**item_data),
-                owner_id=superuser.id,
-            )
+        # 管理者用のアイテムを2件一括作成（ここでは明示的に superuser.id を利用）
+        await ItemService.bulk_create(
+            db_session,
+            [ItemCreate(title=f"Admin Item {i}", description=f"Admin Description {i}") for i in range(2)],
+            owner_id=superuser.id,
+        )
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/items/",
+            f"{ITEMS_URL}/",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
@@ -106,7 +101,7 @@ class TestItemsAPI:
         item_data = {"title": "Get Item By ID", "description": "Test item for get by ID"}
         item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=normal_user.id)
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/items/{item.id}",
+            f"{ITEMS_URL}/{item.id}",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
@@ -122,7 +117,7 @@ class TestItemsAPI:
         item_data = {"title": "Admin Item", "description": "This belongs to admin"}
         admin_item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=superuser.id)
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/items/{admin_item.id}",
+            f"{ITEMS_URL}/{admin_item.id}",
             headers=normal_user_token_headers,
         )
         # 他ユーザーのアイテムは取得できないので 403 Forbidden を想定
@@ -133,7 +128,7 @@ class TestItemsAPI:
     async def test_read_nonexistent_item(self, async_client: AsyncClient, normal_user_token_headers: Dict[str, str], setup_database):
         """存在しないアイテム取得テスト"""
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/items/9999",
+            f"{ITEMS_URL}/9999",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 404
@@ -146,7 +141,7 @@ class TestItemsAPI:
         item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=normal_user.id)
         update_data = {"title": "Updated Title", "description": "Updated description"}
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/items/{item.id}",
+            f"{ITEMS_URL}/{item.id}",
             headers=normal_user_token_headers,
             json=update_data,
         )
@@ -155,9 +150,9 @@ class TestItemsAPI:
         assert updated_item["id"] == item.id
         assert updated_item["title"] == update_data["title"]
         assert updated_item["description"] == update_data["description"]
-        # セッションを最新状態にリフレッシュして確認
-        await db_session.refresh(item)
-        assert item.title == update_data["title"]
+        # DBへの反映はタイトル列のみを取得して確認（ORMインスタンス全体の再読み込みは不要）
+        db_title = await db_session.scalar(select(Item.title).where(Item.id == item.id))
+        assert db_title == update_data["title"]
 
     @pytest.mark.asyncio
     async def test_update_other_user_item(self, async_client: AsyncClient, normal_user_token_headers: Dict[str, str], superuser: User, db_session: AsyncSession, setup_database):
@@ -166,7 +161,7 @@ class TestItemsAPI:
         admin_item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=superuser.id)
         update_data = {"title": "Trying to update", "description": "This should fail"}
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/items/{admin_item.id}",
+            f"{ITEMS_URL}/{admin_item.id}",
             headers=normal_user_token_headers,
             json=update_data,
         )
@@ -179,7 +174,7 @@ class TestItemsAPI:
         item_data = {"title": "Delete Test Item", "description": "This will be deleted"}
         item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=normal_user.id)
         response = await async_client.delete(
-            f"{settings.API_V1_PREFIX}/items/{item.id}",
+            f"{ITEMS_URL}/{item.id}",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 200
@@ -194,7 +189,7 @@ class TestItemsAPI:
         item_data = {"title": "Admin Delete Item", "description": "This belongs to admin"}
         admin_item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=superuser.id)
         response = await async_client.delete(
-            f"{settings.API_V1_PREFIX}/items/{admin_item.id}",
+            f"{ITEMS_URL}/{admin_item.id}",
             headers=normal_user_token_headers,
         )
         assert response.status_code == 403
@@ -206,11 +201,11 @@ class TestItemsAPI:
         item_data = {"title": "User Item for Admin Delete", "description": "This will be deleted by admin"}
         user_item = await ItemService.create(db_session, obj_in=ItemCreate(**item_data), owner_id=normal_user.id)
         response = await async_client.delete(
-            f"{settings.API_V1_PREFIX}/items/{user_item.id}",
+            f"{ITEMS_URL}/{user_item.id}",
             headers=superuser_token_headers,
         )
         assert response.status_code == 200
         deleted_item = response.json()
         assert deleted_item["id"] == user_item.id
         db_item = await ItemService.get(db_session, user_item.id)
-        assert db_item is None
\ No newline at end of file
+        assert db_item is None
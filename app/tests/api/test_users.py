@@ -1,15 +1,21 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict
 
 from app.core.config import settings
 from app.services.user import UserService
 from app.models.user import User
+from app.schemas.user import UserCreate
 
 from datetime import date
 
 
+# エンドポイントURL（テストごとの組み立てを避けるためモジュール読み込み時に一度だけ構築）
+USERS_URL = f"{settings.API_V1_PREFIX}/users"
+
+
 class TestUsersAPI:
     """ユーザーAPI関連のテストクラス"""
 
@@ -20,7 +26,7 @@ class TestUsersAPI:
         """自分自身のユーザー情報取得テスト"""
         # 自分自身の情報を取得
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/me",
+            f"{USERS_URL}/me",
             headers=normal_user_token_headers,
         )
 
@@ -38,7 +44,7 @@ class TestUsersAPI:
         """認証なしでの自分自身のユーザー情報取得テスト"""
         # 認証なしでのリクエスト
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/me",
+            f"{USERS_URL}/me",
         )
 
         # エラーレスポンス検証
@@ -60,7 +66,7 @@ class TestUsersAPI:
 
         # ユーザー情報を更新
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/users/me",
+            f"{USERS_URL}/me",
             headers=normal_user_token_headers,
             json=update_data,
         )
@@ -85,7 +91,7 @@ class TestUsersAPI:
 
         # ユーザー情報を更新
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/users/me",
+            f"{USERS_URL}/me",
             headers=normal_user_token_headers,
             json=update_data,
         )
@@ -106,7 +112,7 @@ class TestUsersAPI:
         """特定のユーザー情報取得テスト（管理者）"""
         # 管理者が一般ユーザーの情報を取得
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/{normal_user.id}",
+            f"{USERS_URL}/{normal_user.id}",
             headers=superuser_token_headers,
         )
 
@@ -126,7 +132,7 @@ class TestUsersAPI:
         """一般ユーザーが他のユーザー情報を取得しようとするテスト（拒否されるべき）"""
         # 一般ユーザーが管理者の情報を取得
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/{superuser.id}",
+            f"{USERS_URL}/{superuser.id}",
             headers=normal_user_token_headers,
         )
 
@@ -141,7 +147,7 @@ class TestUsersAPI:
         """全ユーザー一覧取得テスト（管理者）"""
         # 管理者が全ユーザー一覧を取得
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/",
+            f"{USERS_URL}/",
             headers=superuser_token_headers,
         )
 
@@ -163,7 +169,7 @@ class TestUsersAPI:
         """一般ユーザーが全ユーザー一覧を取得しようとするテスト（拒否されるべき）"""
         # 一般ユーザーが全ユーザー一覧を取得
         response = await async_client.get(
-            f"{settings.API_V1_PREFIX}/users/",
+            f"{USERS_URL}/",
             headers=normal_user_token_headers,
         )
 
@@ -189,7 +195,7 @@ class TestUsersAPI:
 
         # 管理者がユーザーを作成
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/users/",
+            f"{USERS_URL}/",
             headers=superuser_token_headers,
             json=user_data,
         )
@@ -201,10 +207,9 @@ class TestUsersAPI:
         assert new_user["full_name"] == user_data["full_name"]
         assert new_user["is_superuser"] == user_data["is_superuser"]
 
-        # データベースに登録されたことを確認
-        db_user = await UserService.get_by_email(db_session, user_data["email"])
-        assert db_user is not None
-        assert db_user.email == user_data["email"]
+        # データベースに登録されたことを確認（ロール等の関連は不要なため、メールアドレス列のみを取得）
+        db_email = await db_session.scalar(select(User.email).where(User.id == new_user["id"]))
+        assert db_email == user_data["email"]
 
     @pytest.mark.asyncio
     async def test_create_user_normal(
@@ -220,7 +225,7 @@ class TestUsersAPI:
 
         # 一般ユーザーがユーザー作成を試みる
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/users/",
+            f"{USERS_URL}/",
             headers=normal_user_token_headers,
             json=user_data,
         )
@@ -245,7 +250,7 @@ class TestUsersAPI:
 
         # 管理者が一般ユーザーを更新
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/users/{normal_user.id}",
+            f"{USERS_URL}/{normal_user.id}",
             headers=superuser_token_headers,
             json=update_data,
         )
@@ -265,25 +270,18 @@ class TestUsersAPI:
         db_session: AsyncSession,
     ):
         """管理者によるユーザー削除テスト"""
-        # 削除対象のユーザーを作成
-        user_data = {
-            "email": "to_delete@example.com",
-            "password": "deletepassword",
-            "full_name": "User To Delete",
-        }
-
-        create_response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/users/",
-            headers=superuser_token_headers,
-            json=user_data,
+        # 削除対象のユーザーを作成（検証対象は削除APIのため、準備はサービス経由で直接行う）
+        user_in = UserCreate(
+            email="to_delete@example.com",
+            password="deletepassword",
+            full_name="User To Delete",
         )
-
-        created_user = create_response.json()
-        user_id = created_user["id"]
+        created_user = await UserService.create(db_session, obj_in=user_in)
+        user_id = created_user.id
 
         # 管理者がユーザーを削除
         response = await async_client.delete(
-            f"{settings.API_V1_PREFIX}/users/{user_id}",
+            f"{USERS_URL}/{user_id}",
             headers=superuser_token_headers,
         )
 
@@ -293,8 +291,9 @@ class TestUsersAPI:
         assert deleted_user["id"] == user_id
 
         # データベースから削除されたことを確認
-        db_user = await UserService.get(db_session, user_id)
-        assert db_user is None
+        # （準備で作成したインスタンスが db_session の識別マップに残っているため、ID列のみをSQLで取得）
+        db_user_id = await db_session.scalar(select(User.id).where(User.id == user_id))
+        assert db_user_id is None
 
     @pytest.mark.asyncio
     async def test_delete_self_admin(
@@ -306,7 +305,7 @@ class TestUsersAPI:
         """管理者が自分自身を削除しようとするテスト（拒否されるべき）"""
         # 管理者が自分自身を削除
         response = await async_client.delete(
-            f"{settings.API_V1_PREFIX}/users/{superuser.id}",
+            f"{USERS_URL}/{superuser.id}",
             headers=superuser_token_headers,
         )
 
@@ -338,7 +337,7 @@ class TestUsersAPI:
 
         # 管理者がユーザーを作成
         response = await async_client.post(
-            f"{settings.API_V1_PREFIX}/users/",
+            f"{USERS_URL}/",
             headers=superuser_token_headers,
             json=user_data,
         )
@@ -375,7 +374,7 @@ class TestUsersAPI:
 
         # ユーザー情報を更新
         response = await async_client.put(
-            f"{settings.API_V1_PREFIX}/users/me",
+            f"{USERS_URL}/me",
             headers=normal_user_token_headers,
             json=update_data,
         )
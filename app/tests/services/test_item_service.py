@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.item import ItemService
@@ -8,6 +9,19 @@ from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
 
 
+# 取得・更新・削除テストで共通に使用するアイテムデータ
+_ITEM_IN = ItemCreate(
+    title="Test Item",
+    description="Item for get/update/delete tests",
+)
+
+
+# 一般ユーザーが所有するテスト用アイテム（取得・更新・削除テストで共通のセットアップ）
+@pytest_asyncio.fixture
+async def item(db_session: AsyncSession, normal_user: User) -> Item:
+    return await ItemService.create(db_session, obj_in=_ITEM_IN, owner_id=normal_user.id)
+
+
 class TestItemService:
     """ItemServiceのテストクラス"""
 
@@ -30,23 +44,31 @@ class TestItemService:
         assert item.owner_id == normal_user.id
 
     @pytest.mark.asyncio
-    async def test_get_item(self, db_session: AsyncSession, normal_user: User):
+    async def test_bulk_create_items(self, db_session: AsyncSession, normal_user: User):
+        """アイテム一括作成テスト"""
+        items_in = [ItemCreate(title=f"Bulk Item {i}", description=f"Description {i}") for i in range(3)]
+
+        # アイテム一括作成
+        items = await ItemService.bulk_create(db_session, items_in, owner_id=normal_user.id)
+
+        # 検証（入力と同じ順序で、サーバー生成値も含めて返される）
+        assert [item.title for item in items] == [item_in.title for item_in in items_in]
+        for item in items:
+            assert item.id is not None
+            assert item.owner_id == normal_user.id
+            assert item.created_at is not None
+
+    @pytest.mark.asyncio
+    async def test_get_item(self, db_session: AsyncSession, normal_user: User, item: Item):
         """アイテム取得テスト"""
-        # テスト用アイテム作成 - Pydanticモデルを使用
-        item_in = ItemCreate(
-            title="Get Test Item",
-            description="Item for get test",
-        )
-        created_item = await ItemService.create(db_session, obj_in=item_in, owner_id=normal_user.id)
-        
         # アイテム取得
-        item = await ItemService.get(db_session, created_item.id)
+        fetched_item = await ItemService.get(db_session, item.id)
         
         # 検証
-        assert item is not None
-        assert item.id == created_item.id
-        assert item.title == item_in.title
-        assert item.owner_id == normal_user.id
+        assert fetched_item is not None
+        assert fetched_item.id == item.id
+        assert fetched_item.title == _ITEM_IN.title
+        assert fetched_item.owner_id == normal_user.id
 
     @pytest.mark.asyncio
     async def test_get_nonexistent_item(self, db_session: AsyncSession):
@@ -58,15 +80,8 @@ class TestItemService:
         assert item is None
 
     @pytest.mark.asyncio
-    async def test_update_item(self, db_session: AsyncSession, normal_user: User):
+    async def test_update_item(self, db_session: AsyncSession, normal_user: User, item: Item):
         """アイテム更新テスト"""
-        # テスト用アイテム作成 - Pydanticモデルを使用
-        item_in = ItemCreate(
-            title="Update Test Item",
-            description="Item for update test",
-        )
-        item = await ItemService.create(db_session, obj_in=item_in, owner_id=normal_user.id)
-        
         # 更新データ - Pydanticモデルを使用
         update_data = ItemUpdate(
             title="Updated Item Title",
@@ -84,15 +99,8 @@ class TestItemService:
         assert updated_item.owner_id == normal_user.id
 
     @pytest.mark.asyncio
-    async def test_delete_item(self, db_session: AsyncSession, normal_user: User):
+    async def test_delete_item(self, db_session: AsyncSession, item: Item):
         """アイテム削除テスト"""
-        # テスト用アイテム作成 - Pydanticモデルを使用
-        item_in = ItemCreate(
-            title="Delete Test Item",
-            description="Item for delete test",
-        )
-        item = await ItemService.create(db_session, obj_in=item_in, owner_id=normal_user.id)
-        
         # アイテム削除
         deleted_item = await ItemService.delete(db_session, item.id)
         
@@ -114,18 +122,17 @@ class TestItemService:
     @pytest.mark.asyncio
     async def test_get_multi_items(self, db_session: AsyncSession, normal_user: User, superuser: User):
         """複数アイテムの取得テスト"""
-        # テスト用アイテム作成（各ユーザーに2つずつ）- Pydanticモデルを使用
-        for i in range(2):
-            await ItemService.create(
-                db_session,
-                obj_in=ItemCreate(title=f"User Item {i}", description=f"Description {i}"),
-                owner_id=normal_user.id,
-            )
-            await ItemService.create(
-                db_session,
-                obj_in=ItemCreate(title=f"Admin Item {i}", description=f"Description {i}"),
-                owner_id=superuser.id,
-            )
+        # テスト用アイテム作成（各ユーザーに2つずつ、ユーザーごとに一括作成）- Pydanticモデルを使用
+        await ItemService.bulk_create(
+            db_session,
+            [ItemCreate(title=f"User Item {i}", description=f"Description {i}") for i in range(2)],
+            owner_id=normal_user.id,
+        )
+        await ItemService.bulk_create(
+            db_session,
+            [ItemCreate(title=f"Admin Item {i}", description=f"Description {i}") for i in range(2)],
+            owner_id=superuser.id,
+        )
         
         # すべてのアイテム取得
         all_items, total_count = await ItemService.get_multi(db_session)
@@ -146,13 +153,12 @@ class TestItemService:
     @pytest.mark.asyncio
     async def test_get_page_items(self, db_session: AsyncSession, normal_user: User):
         """ページネーション付きアイテム取得テスト"""
-        # テスト用アイテム作成（5つ）- Pydanticモデルを使用
-        for i in range(5):
-            await ItemService.create(
-                db_session,
-                obj_in=ItemCreate(title=f"Page Item {i}", description=f"Description {i}"),
-                owner_id=normal_user.id,
-            )
+        # テスト用アイテム作成（5つを一括作成）- Pydanticモデルを使用
+        await ItemService.bulk_create(
+            db_session,
+            [ItemCreate(title=f"Page Item {i}", description=f"Description {i}") for i in range(5)],
+            owner_id=normal_user.id,
+        )
         
         # ページネーション付きでアイテム取得（1ページ目、サイズ2）
         page1 = await ItemService.get_page(db_session, page=1, size=2, owner_id=normal_user.id)
@@ -0,0 +1,57 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.location import LocationService
+from app.models.location import Location, LocationType
+from app.schemas.location import LocationCreate
+
+
+# 検索テスト用の拠点
+@pytest_asyncio.fixture
+async def shibuya_location(db_session: AsyncSession) -> Location:
+    return await LocationService.create(
+        db_session,
+        obj_in=LocationCreate(
+            name="東京都渋谷区営業所",
+            code="TKY-001",
+            type=LocationType.OFFICE,
+            prefecture="東京都",
+            city="渋谷区",
+            address1="道玄坂1-2-3",
+        ),
+    )
+
+
+class TestLocationService:
+    """LocationServiceのテストクラス"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "search",
+        [
+            "渋谷",  # 日本語の部分文字列（'simple' パーサでは1語として扱われる）
+            "KY",  # 拠点コードの語の途中の文字列
+            "tky 道玄坂",  # 別の列にある複数語の前方一致（全文検索）
+        ],
+    )
+    async def test_get_multi_search(
+        self, db_session: AsyncSession, shibuya_location: Location, search: str
+    ):
+        """部分一致・語単位の検索のいずれでも拠点が見つかることのテスト"""
+        locations, total = await LocationService.get_multi(db_session, search=search)
+
+        # 検証
+        assert total >= 1
+        assert shibuya_location.id in {location.id for location in locations}
+
+    @pytest.mark.asyncio
+    async def test_get_multi_search_no_match(
+        self, db_session: AsyncSession, shibuya_location: Location
+    ):
+        """一致しない検索語では拠点が返らないことのテスト"""
+        locations, total = await LocationService.get_multi(db_session, search="新宿")
+
+        # 検証
+        assert total == 0
+        assert locations == []
@@ -1,13 +1,36 @@
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.user import UserService
 from app.core.exceptions import ConflictException, NotFoundException
+from app.models.role import Role
 from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate
+from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
 from datetime import date
 
 
+# テストで使用するユーザー作成データ（内容は固定のため、モジュール読み込み時に一度だけ検証・構築する）
+# ※ 検証エラーになるデータをここに置くとモジュール全体が収集エラーになるため、有効なデータのみとする
+_DUPLICATE_USER_IN = UserCreate(
+    email="test_duplicate@example.com",
+    password="testpassword",
+    full_name="Test User",
+)
+
+_MIXED_CASE_USER_IN = UserCreate(
+    email="Mixed.Case@Example.com",
+    password="testpassword",
+    full_name="Mixed Case",
+)
+
+_DELETE_USER_IN = UserCreate(
+    email="delete_test@example.com",
+    password="deletepassword",
+    full_name="Delete Test User",
+)
+
+
 class TestUserService:
     """UserServiceのテストクラス"""
 
@@ -40,11 +63,7 @@ class TestUserService:
     async def test_create_user_duplicate_email(self, db_session: AsyncSession):
         """重複メールアドレスによるユーザー作成の異常系テスト"""
         # テスト用ユーザーデータ - Pydanticモデルを使用
-        user_in = UserCreate(
-            email="test_duplicate@example.com",
-            password="testpassword",
-            full_name="Test User",
-        )
+        user_in = _DUPLICATE_USER_IN
 
         # 最初のユーザー作成
         await UserService.create(db_session, obj_in=user_in)
@@ -75,6 +94,17 @@ class TestUserService:
         assert user.id == normal_user.id
         assert user.email == normal_user.email
 
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_case_insensitive(self, db_session: AsyncSession):
+        """メールアドレスの大文字小文字を区別しない取得テスト"""
+        created = await UserService.create(db_session, obj_in=_MIXED_CASE_USER_IN)
+
+        # 検証（小文字で保存され、大文字を含む指定でも取得できる）
+        assert created.email == "mixed.case@example.com"
+        user = await UserService.get_by_email(db_session, "MIXED.case@example.COM")
+        assert user is not None
+        assert user.id == created.id
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_user(self, db_session: AsyncSession):
         """存在しないユーザーの取得テスト"""
@@ -106,6 +136,37 @@ class TestUserService:
         # 更新前のハッシュ値と新しいハッシュ値が異なることを確認
         assert updated_user.hashed_password != old_hash
 
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_after_update(self, db_session: AsyncSession, normal_user: User):
+        """更新後のメールアドレス検索でキャッシュ済みの古い情報が返らないことのテスト"""
+        # キャッシュに載せる
+        await UserService.get_by_email(db_session, normal_user.email)
+
+        # ユーザー更新
+        await UserService.update(db_session, normal_user, {"full_name": "Cached Name"})
+
+        # 検証
+        user = await UserService.get_by_email(db_session, normal_user.email)
+        assert user is not None
+        assert user.full_name == "Cached Name"
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_returns_callers_session_instance(
+        self, db_session: AsyncSession, normal_user: User
+    ):
+        """キャッシュ経由の取得でも、他セッションのインスタンスではなく呼び出し元セッションのインスタンスが返ることのテスト"""
+        # 別セッションで取得してキャッシュに載せる
+        async with AsyncSession(bind=await db_session.connection()) as other_session:
+            other_user = await UserService.get_by_email(other_session, normal_user.email)
+            assert other_user in other_session
+
+            # 検証（キャッシュ済みでも、呼び出し元セッションのインスタンスが返る）
+            user = await UserService.get_by_email(db_session, normal_user.email)
+            assert user is not None
+            assert user is not other_user
+            assert user in db_session
+            assert user not in other_session
+
     @pytest.mark.asyncio
     async def test_authenticate_user(self, db_session: AsyncSession):
         """ユーザー認証テスト"""
@@ -151,13 +212,7 @@ class TestUserService:
     async def test_delete_user(self, db_session: AsyncSession):
         """ユーザー削除テスト"""
         # テスト用ユーザー作成 - Pydanticモデルを使用
-        user_in = UserCreate(
-            email="delete_test@example.com",
-            password="deletepassword",
-            full_name="Delete Test User",
-        )
-
-        user = await UserService.create(db_session, obj_in=user_in)
+        user = await UserService.create(db_session, obj_in=_DELETE_USER_IN)
 
         # ユーザー削除
         deleted_user = await UserService.delete(db_session, user.id)
@@ -196,6 +251,44 @@ class TestUserService:
         for user in active_users:
             assert user.is_active is True
 
+    @pytest.mark.asyncio
+    async def test_get_multi_users_serializes_without_lazy_load(
+        self, db_session: AsyncSession, normal_user: User, superuser: User
+    ):
+        """一覧取得結果のシリアライズで追加の遅延ロード（N+1）が発生しないことのテスト"""
+        users = await UserService.get_multi(db_session)
+
+        # raiseload("*") により、計画外のリレーションシップアクセスは InvalidRequestError となる
+        try:
+            serialized = [UserSchema.model_validate(user) for user in users]
+        except InvalidRequestError as e:
+            pytest.fail(f"一覧のシリアライズ中に遅延ロードが発生しました: {e}")
+
+        assert len(serialized) == len(users)
+
+    @pytest.mark.asyncio
+    async def test_get_multi_users_attaches_roles_to_callers_session(
+        self, db_session: AsyncSession, normal_user: User
+    ):
+        """キャッシュ済みのロールが、他セッションのインスタンスではなく呼び出し元セッションに取り込まれて紐付くことのテスト"""
+        role = Role(name="cache_test_role", is_system_role=False)
+        db_session.add(role)
+        await db_session.commit()
+        await UserService.update(db_session, normal_user, {"role_id": role.id})
+
+        # 別セッションで一覧取得してロールをキャッシュに載せる
+        async with AsyncSession(bind=await db_session.connection()) as other_session:
+            other_users = await UserService.get_multi(other_session, role_id=role.id)
+            assert other_users[0].role in other_session
+
+            # 検証（キャッシュ済みでも、呼び出し元セッションのロールが紐付く）
+            users = await UserService.get_multi(db_session, role_id=role.id)
+            assert len(users) == 1
+            assert users[0].role is not None
+            assert users[0].role.id == role.id
+            assert users[0].role in db_session
+            assert users[0].role not in other_session
+
 
 @pytest.mark.asyncio
 async def test_create_user_with_new_fields(db_session: AsyncSession):
@@ -22,6 +22,7 @@ cd "$PROJECT_ROOT"
 TEST_PATH="app/tests"
 COVERAGE=false
 VERBOSE=false
+PARALLEL=false
 
 # 引数の解析
 while [[ $# -gt 0 ]]; do
@@ -38,6 +39,10 @@ while [[ $# -gt 0 ]]; do
             VERBOSE=true
             shift
             ;;
+        -p|--parallel)
+            PARALLEL=true
+            shift
+            ;;
         -h|--help)
             echo -e "${GREEN}UniCore テスト実行スクリプト${NC}"
             echo "使用法: $0 [オプション]"
@@ -45,6 +50,7 @@ while [[ $# -gt 0 ]]; do
             echo "  -t, --test PATH     指定したパスのテストを実行 (デフォルト: app/tests)"
             echo "  -c, --coverage      カバレッジレポートを生成"
             echo "  -v, --verbose       詳細な出力"
+            echo "  -p, --parallel      pytest-xdist でテストクラス単位に並列実行（ワーカーごとに専用DBを作成）"
             echo "  -h, --help          このヘルプを表示"
             exit 0
             ;;
@@ -76,6 +82,11 @@ else
     export FIRST_SUPERUSER_PASSWORD="admintestpassword"
 fi
 
+# 並列実行オプション（同じクラスのテストは同じワーカーで実行）
+if [ "$PARALLEL" = true ]; then
+    TEST_PATH="$TEST_PATH -n auto --dist loadscope"
+fi
+
 # テスト実行
 if [ "$COVERAGE" = true ]; then
     echo -e "${GREEN}カバレッジレポート付きでテストを実行しています...${NC}"